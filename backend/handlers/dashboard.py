@@ -97,7 +97,8 @@ async def record_llm_usage(body: RecordLLMUsageRequest) -> Dict[str, Any]:
     """
     try:
         dashboard_manager = get_dashboard_manager()
-        success = dashboard_manager.record_llm_usage(
+        # record_llm_request derives total_tokens when the client omits it
+        success = dashboard_manager.record_llm_request(
             model=body.model,
             prompt_tokens=body.prompt_tokens,
             completion_tokens=body.completion_tokens,
@@ -10,6 +10,7 @@ from typing import List
 from core.logger import get_logger
 from core.settings import get_settings
 from models import BaseModel
+from models.requests import ImageOptimizationStrategy
 from processing.image_manager import get_image_manager
 from processing.image_optimization import get_image_filter
 
@@ -202,7 +203,7 @@ class ImageOptimizationConfigRequest(BaseModel):
     """Image optimization configuration update request"""
 
     enabled: bool = True
-    strategy: str = "hybrid"  # none, sampling, content_aware, hybrid
+    strategy: ImageOptimizationStrategy = "hybrid"
     phash_threshold: float = 0.15
     min_interval: float = 2.0
     max_images: int = 8
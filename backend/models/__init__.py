@@ -3,11 +3,12 @@ Models for PyTauri command communication
 Data models for PyTauri command communication
 """
 
-from .base import BaseModel
+from .base import BaseModel, RequestModel
 from .requests import (
     CleanupOldDataRequest,
     DeleteActivitiesByDateRequest,
     DeleteActivityRequest,
+    DeleteByDateRangeRequest,
     DeleteDiariesByDateRequest,
     DeleteEventRequest,
     DeleteKnowledgeByDateRequest,
@@ -28,6 +29,7 @@ from .requests import (
 __all__ = [
     # Base
     "BaseModel",
+    "RequestModel",
     # Demo
     "Person",
     # Perception
@@ -39,6 +41,7 @@ __all__ = [
     "GetActivityByIdRequest",
     "DeleteActivityRequest",
     "DeleteEventRequest",
+    "DeleteByDateRangeRequest",
     "DeleteActivitiesByDateRequest",
     "DeleteKnowledgeByDateRequest",
     "DeleteTodosByDateRequest",
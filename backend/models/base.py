@@ -38,6 +38,15 @@ class BaseModel(PydanticBaseModel):
         return super().model_dump(**kwargs)
 
 
+class RequestModel(BaseModel):
+    """Base model for command request payloads.
+
+    Requests are one-shot DTOs that handlers only read, so they are frozen.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+
 class LLMTokenUsage(BaseModel):
     """LLM Token Usage Statistics Model"""
 
@@ -4,18 +4,38 @@ Request models for PyTauri commands
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Annotated, Literal
 
-from pydantic import Field
+from pydantic import ConfigDict, Field, StrictBool, StringConstraints
 
-from .base import BaseModel
+from .base import RequestModel
+
+# Config for models only used by rarely called settings/admin commands:
+# their core schema is built on first use instead of at import time.
+_COLD_PATH_CONFIG = ConfigDict(defer_build=True)
+
+# Shared string constraints reused across request models
+NonEmptyStr = Annotated[str, StringConstraints(min_length=1)]
+NameStr = Annotated[str, StringConstraints(min_length=1, max_length=100)]
+ProviderStr = Annotated[str, StringConstraints(min_length=1, max_length=50)]
+DateStr = Annotated[str, StringConstraints(pattern=r"^\d{4}-\d{2}-\d{2}$")]
+TimeStr = Annotated[str, StringConstraints(pattern=r"^\d{2}:\d{2}$")]
+
+# Currency codes offered by the model management UI
+Currency = Literal["USD", "CNY", "EUR", "GBP", "JPY"]
+
+# Image compression levels understood by the image optimizer
+CompressionLevel = Literal["ultra", "aggressive", "balanced", "quality"]
+
+# Image optimization strategies (see [image_optimization] in config.toml)
+ImageOptimizationStrategy = Literal["none", "sampling", "content_aware", "hybrid"]
 
 # ============================================================================
 # Demo Request Models
 # ============================================================================
 
 
-class Person(BaseModel):
+class Person(RequestModel):
     """A simple model representing a person.
 
     @property name - The name of the person.
@@ -29,7 +49,7 @@ class Person(BaseModel):
 # ============================================================================
 
 
-class GetRecordsRequest(BaseModel):
+class GetRecordsRequest(RequestModel):
     """Request parameters for getting records.
 
     @property limit - Maximum number of records to return (1-1000).
@@ -39,9 +59,9 @@ class GetRecordsRequest(BaseModel):
     """
 
     limit: int = Field(default=100, ge=1, le=1000)
-    event_type: Optional[str] = None
-    start_time: Optional[str] = None
-    end_time: Optional[str] = None
+    event_type: str | None = None
+    start_time: str | None = None
+    end_time: str | None = None
 
 
 # ============================================================================
@@ -49,7 +69,7 @@ class GetRecordsRequest(BaseModel):
 # ============================================================================
 
 
-class GetEventsRequest(BaseModel):
+class GetEventsRequest(RequestModel):
     """Request parameters for getting events.
 
     @property limit - Maximum number of events to return (1-500).
@@ -59,12 +79,12 @@ class GetEventsRequest(BaseModel):
     """
 
     limit: int = Field(default=50, ge=1, le=500)
-    event_type: Optional[str] = None
-    start_time: Optional[str] = None
-    end_time: Optional[str] = None
+    event_type: str | None = None
+    start_time: str | None = None
+    end_time: str | None = None
 
 
-class GetActivitiesRequest(BaseModel):
+class GetActivitiesRequest(RequestModel):
     """Request parameters for getting activities.
 
     @property limit - Maximum number of activities to return (1-100).
@@ -75,7 +95,7 @@ class GetActivitiesRequest(BaseModel):
     offset: int = Field(default=0, ge=0)
 
 
-class GetEventByIdRequest(BaseModel):
+class GetEventByIdRequest(RequestModel):
     """Request parameters for getting event by ID.
 
     @property eventId - The event ID.
@@ -84,7 +104,7 @@ class GetEventByIdRequest(BaseModel):
     event_id: str
 
 
-class GetActivityByIdRequest(BaseModel):
+class GetActivityByIdRequest(RequestModel):
     """Request parameters for getting activity by ID.
 
     @property activityId - The activity ID.
@@ -93,7 +113,7 @@ class GetActivityByIdRequest(BaseModel):
     activity_id: str
 
 
-class DeleteActivityRequest(BaseModel):
+class DeleteActivityRequest(RequestModel):
     """Request parameters for deleting an activity.
 
     @property activityId - The activity ID to delete.
@@ -102,7 +122,7 @@ class DeleteActivityRequest(BaseModel):
     activity_id: str
 
 
-class DeleteEventRequest(BaseModel):
+class DeleteEventRequest(RequestModel):
     """Request parameters for deleting an event.
 
     @property eventId - The event ID to delete.
@@ -111,16 +131,18 @@ class DeleteEventRequest(BaseModel):
     event_id: str
 
 
-class CleanupOldDataRequest(BaseModel):
+class CleanupOldDataRequest(RequestModel):
     """Request parameters for cleaning up old data.
 
     @property days - Number of days to keep (1-365).
     """
 
+    model_config = _COLD_PATH_CONFIG
+
     days: int = Field(default=30, ge=1, le=365)
 
 
-class GetActivitiesIncrementalRequest(BaseModel):
+class GetActivitiesIncrementalRequest(RequestModel):
     """Request parameters for incremental activity updates.
 
     @property version - The current version number from client (starts at 0).
@@ -131,7 +153,7 @@ class GetActivitiesIncrementalRequest(BaseModel):
     limit: int = Field(default=50, ge=1, le=100)
 
 
-class GetActivityCountByDateRequest(BaseModel):
+class GetActivityCountByDateRequest(RequestModel):
     """Request parameters for getting activity count by date.
 
     Returns the total activity count for each date (no pagination, gets total count for all dates).
@@ -145,7 +167,7 @@ class GetActivityCountByDateRequest(BaseModel):
 # ============================================================================
 
 
-class CreateTaskRequest(BaseModel):
+class CreateTaskRequest(RequestModel):
     """Request parameters for creating a new agent task.
 
     @property agent - The agent type to use.
@@ -156,7 +178,7 @@ class CreateTaskRequest(BaseModel):
     plan_description: str
 
 
-class ExecuteTaskRequest(BaseModel):
+class ExecuteTaskRequest(RequestModel):
     """Request parameters for executing a task.
 
     @property taskId - The task ID to execute.
@@ -165,7 +187,7 @@ class ExecuteTaskRequest(BaseModel):
     task_id: str
 
 
-class DeleteTaskRequest(BaseModel):
+class DeleteTaskRequest(RequestModel):
     """Request parameters for deleting a task.
 
     @property taskId - The task ID to delete.
@@ -174,7 +196,7 @@ class DeleteTaskRequest(BaseModel):
     task_id: str
 
 
-class GetTasksRequest(BaseModel):
+class GetTasksRequest(RequestModel):
     """Request parameters for getting tasks.
 
     @property limit - Maximum number of tasks to return (1-100).
@@ -182,10 +204,10 @@ class GetTasksRequest(BaseModel):
     """
 
     limit: int = Field(default=50, ge=1, le=100)
-    status: Optional[str] = None
+    status: str | None = None
 
 
-class GetAvailableAgentsRequest(BaseModel):
+class GetAvailableAgentsRequest(RequestModel):
     """Request parameters for getting available agents.
 
     No parameters needed.
@@ -194,44 +216,44 @@ class GetAvailableAgentsRequest(BaseModel):
     pass
 
 
-class ScheduleTaskRequest(BaseModel):
+class ScheduleTaskRequest(RequestModel):
     """Request parameters for scheduling a task to a specific date.
 
     @property taskId - The task ID to schedule.
     @property scheduledDate - The date to schedule the task (YYYY-MM-DD format).
     """
 
-    task_id: str = Field(..., min_length=1)
-    scheduled_date: str = Field(..., pattern=r"^\d{4}-\d{2}-\d{2}$")
+    task_id: NonEmptyStr
+    scheduled_date: DateStr
 
 
-class UnscheduleTaskRequest(BaseModel):
+class UnscheduleTaskRequest(RequestModel):
     """Request parameters for moving a task back to pending.
 
     @property taskId - The task ID to unschedule.
     """
 
-    task_id: str = Field(..., min_length=1)
+    task_id: NonEmptyStr
 
 
-class GetTasksByDateRequest(BaseModel):
+class GetTasksByDateRequest(RequestModel):
     """Request parameters for getting tasks scheduled for a specific date.
 
     @property scheduledDate - The date to query tasks (YYYY-MM-DD format).
     """
 
-    scheduled_date: str = Field(..., pattern=r"^\d{4}-\d{2}-\d{2}$")
+    scheduled_date: DateStr
 
 
-class ExecuteTaskInChatRequest(BaseModel):
+class ExecuteTaskInChatRequest(RequestModel):
     """Request parameters for executing a task in chat.
 
     @property taskId - The task ID to execute.
     @property conversationId - Optional conversation ID, creates new if not provided.
     """
 
-    task_id: str = Field(..., min_length=1)
-    conversation_id: Optional[str] = None
+    task_id: NonEmptyStr
+    conversation_id: str | None = None
 
 
 # ============================================================================
@@ -239,7 +261,7 @@ class ExecuteTaskInChatRequest(BaseModel):
 # ============================================================================
 
 
-class UpdateSettingsRequest(BaseModel):
+class UpdateSettingsRequest(RequestModel):
     """Request parameters for updating application settings.
 
     Note: LLM configuration has been migrated to multi-model management system
@@ -249,11 +271,13 @@ class UpdateSettingsRequest(BaseModel):
     @property screenshotSavePath - Path to save screenshots (optional).
     """
 
-    database_path: Optional[str] = None
-    screenshot_save_path: Optional[str] = None
+    model_config = _COLD_PATH_CONFIG
 
+    database_path: str | None = None
+    screenshot_save_path: str | None = None
 
-class UpdateLive2DSettingsRequest(BaseModel):
+
+class UpdateLive2DSettingsRequest(RequestModel):
     """Request parameters for updating Live2D configuration.
 
     @property enabled - Whether the Live2D companion window should be shown.
@@ -263,18 +287,20 @@ class UpdateLive2DSettingsRequest(BaseModel):
     @property notificationDuration - Duration in milliseconds for notification display (1000-30000).
     """
 
-    enabled: Optional[bool] = None
-    selected_model_url: Optional[str] = None
-    model_dir: Optional[str] = None
-    remote_models: Optional[List[str]] = None
-    notification_duration: Optional[int] = Field(default=None, ge=1000, le=30000)
+    model_config = _COLD_PATH_CONFIG
+
+    enabled: StrictBool | None = None
+    selected_model_url: str | None = None
+    model_dir: str | None = None
+    remote_models: list[str] | None = None
+    notification_duration: int | None = Field(default=None, ge=1000, le=30000)
 
 
-class ImageOptimizationConfigRequest(BaseModel):
+class ImageOptimizationConfigRequest(RequestModel):
     """Request parameters for updating image optimization configuration.
 
     @property enabled - Whether image optimization is enabled.
-    @property strategy - Optimization strategy ('phash', 'sampling', 'hybrid').
+    @property strategy - Optimization strategy ('none', 'sampling', 'content_aware', 'hybrid').
     @property phashThreshold - Perceptual hash similarity threshold (0.0-1.0).
     @property minInterval - Minimum time interval between images (seconds).
     @property maxImages - Maximum number of images per event.
@@ -282,16 +308,18 @@ class ImageOptimizationConfigRequest(BaseModel):
     @property enableTextDetection - Enable text detection for OCR-capable images.
     """
 
-    enabled: Optional[bool] = None
-    strategy: Optional[str] = None
-    phash_threshold: Optional[float] = Field(default=None, ge=0.0, le=1.0)
-    min_interval: Optional[float] = Field(default=None, ge=0.0)
-    max_images: Optional[int] = Field(default=None, ge=1, le=50)
-    enable_content_analysis: Optional[bool] = None
-    enable_text_detection: Optional[bool] = None
+    model_config = _COLD_PATH_CONFIG
+
+    enabled: StrictBool | None = None
+    strategy: ImageOptimizationStrategy | None = None
+    phash_threshold: float | None = Field(default=None, ge=0.0, le=1.0)
+    min_interval: float | None = Field(default=None, ge=0.0)
+    max_images: int | None = Field(default=None, ge=1, le=50)
+    enable_content_analysis: StrictBool | None = None
+    enable_text_detection: StrictBool | None = None
 
 
-class ImageCompressionConfigRequest(BaseModel):
+class ImageCompressionConfigRequest(RequestModel):
     """Request parameters for updating image compression configuration.
 
     @property compressionLevel - Compression level ('ultra', 'aggressive', 'balanced', 'quality').
@@ -299,11 +327,11 @@ class ImageCompressionConfigRequest(BaseModel):
     @property cropThreshold - Crop threshold percentage (0-100).
     """
 
-    compression_level: Optional[str] = Field(
-        default=None, pattern="^(ultra|aggressive|balanced|quality)$"
-    )
-    enable_region_cropping: Optional[bool] = None
-    crop_threshold: Optional[int] = Field(default=None, ge=0, le=100)
+    model_config = _COLD_PATH_CONFIG
+
+    compression_level: CompressionLevel | None = None
+    enable_region_cropping: StrictBool | None = None
+    crop_threshold: int | None = Field(default=None, ge=0, le=100)
 
 
 # ============================================================================
@@ -311,7 +339,7 @@ class ImageCompressionConfigRequest(BaseModel):
 # ============================================================================
 
 
-class ModelConfig(BaseModel):
+class ModelConfig(RequestModel):
     """Model configuration model for storage and API.
 
     @property id - Unique model identifier (UUID or auto-generated).
@@ -327,20 +355,22 @@ class ModelConfig(BaseModel):
     @property updatedAt - Last update timestamp (ISO format).
     """
 
-    id: Optional[str] = None
-    name: str = Field(..., min_length=1, max_length=100)
-    provider: str = Field(default="openai", min_length=1, max_length=50)  # Always 'openai' for OpenAI-compatible APIs
-    api_url: str = Field(..., min_length=1)
-    model: str = Field(..., min_length=1, max_length=100)
+    model_config = _COLD_PATH_CONFIG
+
+    id: str | None = None
+    name: NameStr
+    provider: ProviderStr = "openai"  # Always 'openai' for OpenAI-compatible APIs
+    api_url: NonEmptyStr
+    model: NameStr
     input_token_price: float = Field(..., ge=0)
     output_token_price: float = Field(..., ge=0)
-    currency: str = Field(default="USD", min_length=3, max_length=3)
-    is_active: Optional[bool] = False
-    created_at: Optional[str] = None
-    updated_at: Optional[str] = None
+    currency: Currency = "USD"
+    is_active: bool = False
+    created_at: str | None = None
+    updated_at: str | None = None
 
 
-class CreateModelRequest(BaseModel):
+class CreateModelRequest(RequestModel):
     """Request parameters for creating a new model configuration.
 
     @property name - Display name for the model.
@@ -354,19 +384,21 @@ class CreateModelRequest(BaseModel):
     Note: Provider is automatically set to 'openai' for OpenAI-compatible APIs.
     """
 
-    name: str = Field(..., min_length=1, max_length=100)
-    provider: Optional[str] = Field(
-        default="openai", min_length=1, max_length=50, description="Provider identifier"
+    model_config = _COLD_PATH_CONFIG
+
+    name: NameStr
+    provider: ProviderStr | None = Field(
+        default="openai", description="Provider identifier"
     )
-    api_url: str = Field(..., min_length=1)
-    model: str = Field(..., min_length=1, max_length=100)
+    api_url: NonEmptyStr
+    model: NameStr
     input_token_price: float = Field(..., ge=0)
     output_token_price: float = Field(..., ge=0)
-    currency: str = Field(default="USD", min_length=3, max_length=3)
-    api_key: str = Field(..., min_length=1)
+    currency: Currency = "USD"
+    api_key: NonEmptyStr
 
 
-class UpdateModelRequest(BaseModel):
+class UpdateModelRequest(RequestModel):
     """Request parameters for updating a model configuration.
 
     @property modelId - The ID of the model to update.
@@ -381,44 +413,37 @@ class UpdateModelRequest(BaseModel):
     Note: Provider field is removed - all models use OpenAI-compatible format.
     """
 
-    model_id: str = Field(..., min_length=1)
-    name: Optional[str] = Field(default=None, min_length=1, max_length=100)
-    api_url: Optional[str] = Field(default=None, min_length=1)
-    model: Optional[str] = Field(default=None, min_length=1, max_length=100)
-    input_token_price: Optional[float] = Field(default=None, ge=0)
-    output_token_price: Optional[float] = Field(default=None, ge=0)
-    provider: Optional[str] = Field(
-        default="openai", min_length=1, max_length=50, description="Provider identifier"
-    )
-    currency: Optional[str] = Field(default=None, min_length=3, max_length=3)
-    api_key: Optional[str] = Field(default=None, min_length=1)
-
-
-class DeleteModelRequest(BaseModel):
-    """Request parameters for deleting a model configuration.
+    model_config = _COLD_PATH_CONFIG
 
-    @property modelId - The ID of the model to delete.
-    """
+    model_id: NonEmptyStr
+    name: NameStr | None = None
+    api_url: NonEmptyStr | None = None
+    model: NameStr | None = None
+    input_token_price: float | None = Field(default=None, ge=0)
+    output_token_price: float | None = Field(default=None, ge=0)
+    provider: ProviderStr | None = Field(
+        default="openai", description="Provider identifier"
+    )
+    currency: Currency | None = None
+    api_key: NonEmptyStr | None = None
 
-    model_id: str = Field(..., min_length=1)
 
+class ModelIdRequest(RequestModel):
+    """Request parameters for operating on a single model configuration.
 
-class SelectModelRequest(BaseModel):
-    """Request parameters for selecting/switching to a model.
+    Shared by delete/select/test and per-model LLM statistics requests.
 
-    @property modelId - The ID of the model to activate.
+    @property modelId - The ID of the model configuration.
     """
 
-    model_id: str = Field(..., min_length=1)
-
+    model_id: NonEmptyStr
 
-class TestModelRequest(BaseModel):
-    """Request parameters for testing model connectivity.
 
-    @property modelId - The ID of the model to test.
-    """
-
-    model_id: str = Field(..., min_length=1)
+# These requests only carry a model ID, so they share a single model
+# (and a single compiled validator/serializer).
+DeleteModelRequest = ModelIdRequest
+SelectModelRequest = ModelIdRequest
+TestModelRequest = ModelIdRequest
 
 
 # ============================================================================
@@ -426,13 +451,13 @@ class TestModelRequest(BaseModel):
 # ============================================================================
 
 
-class RecordLLMUsageRequest(BaseModel):
+class RecordLLMUsageRequest(RequestModel):
     """Request parameters for recording LLM usage statistics.
 
     @property model - The LLM model name used.
     @property promptTokens - Number of prompt tokens consumed.
     @property completionTokens - Number of completion tokens consumed.
-    @property totalTokens - Total number of tokens consumed.
+    @property totalTokens - Total number of tokens consumed (optional, defaults to prompt + completion).
     @property cost - Cost of the request (optional).
     @property requestType - Type of request (e.g., 'summarization', 'agent', 'chat').
     """
@@ -440,21 +465,15 @@ class RecordLLMUsageRequest(BaseModel):
     model: str
     prompt_tokens: int = Field(default=0, ge=0)
     completion_tokens: int = Field(default=0, ge=0)
-    total_tokens: int = Field(default=0, ge=0)
+    total_tokens: int | None = Field(default=None, ge=0)
     cost: float = Field(default=0.0, ge=0.0)
     request_type: str
 
 
-class GetLLMStatsByModelRequest(BaseModel):
-    """Request parameters for retrieving LLM statistics of a specific model.
-
-    @property modelId - The model configuration ID.
-    """
-
-    model_id: str = Field(..., min_length=1)
+GetLLMStatsByModelRequest = ModelIdRequest
 
 
-class GetLLMUsageTrendRequest(BaseModel):
+class GetLLMUsageTrendRequest(RequestModel):
     """Request parameters for retrieving LLM usage trend data.
 
     @property dimension - Time dimension for aggregation ('day', 'week', 'month', 'custom').
@@ -466,9 +485,9 @@ class GetLLMUsageTrendRequest(BaseModel):
 
     dimension: str = Field(default="day", pattern="^(day|week|month|custom)$")
     days: int = Field(default=30, ge=1, le=365)
-    start_date: Optional[datetime] = None
-    end_date: Optional[datetime] = None
-    model_config_id: Optional[str] = None
+    start_date: datetime | None = None
+    end_date: datetime | None = None
+    model_config_id: str | None = None
 
 
 # ============================================================================
@@ -476,7 +495,7 @@ class GetLLMUsageTrendRequest(BaseModel):
 # ============================================================================
 
 
-class UpdateFriendlyChatSettingsRequest(BaseModel):
+class UpdateFriendlyChatSettingsRequest(RequestModel):
     """Request parameters for updating friendly chat settings.
 
     @property enabled - Whether friendly chat feature is enabled.
@@ -486,14 +505,16 @@ class UpdateFriendlyChatSettingsRequest(BaseModel):
     @property enableLive2dDisplay - Whether to display in Live2D character.
     """
 
-    enabled: Optional[bool] = None
-    interval: Optional[int] = Field(default=None, ge=1, le=120)
-    data_window: Optional[int] = Field(default=None, ge=5, le=120)
-    enable_system_notification: Optional[bool] = None
-    enable_live2d_display: Optional[bool] = None
+    model_config = _COLD_PATH_CONFIG
+
+    enabled: StrictBool | None = None
+    interval: int | None = Field(default=None, ge=1, le=120)
+    data_window: int | None = Field(default=None, ge=5, le=120)
+    enable_system_notification: StrictBool | None = None
+    enable_live2d_display: StrictBool | None = None
 
 
-class GetFriendlyChatHistoryRequest(BaseModel):
+class GetFriendlyChatHistoryRequest(RequestModel):
     """Request parameters for getting friendly chat history.
 
     @property limit - Maximum number of chat messages to return (1-100).
@@ -509,7 +530,7 @@ class GetFriendlyChatHistoryRequest(BaseModel):
 # ============================================================================
 
 
-class GetRecentEventsRequest(BaseModel):
+class GetRecentEventsRequest(RequestModel):
     """Request parameters for getting recent events.
 
     @property limit - Maximum number of events to return (1-200).
@@ -520,25 +541,25 @@ class GetRecentEventsRequest(BaseModel):
     offset: int = Field(default=0, ge=0)
 
 
-class DeleteItemRequest(BaseModel):
+class DeleteItemRequest(RequestModel):
     """Request parameters for deleting an item (knowledge/todo/diary).
 
     @property id - The item ID to delete.
     """
 
-    id: str = Field(..., min_length=1)
+    id: NonEmptyStr
 
 
-class GenerateDiaryRequest(BaseModel):
+class GenerateDiaryRequest(RequestModel):
     """Request parameters for generating a diary.
 
     @property date - The date for the diary (YYYY-MM-DD format).
     """
 
-    date: str = Field(..., pattern=r"^\d{4}-\d{2}-\d{2}$")
+    date: DateStr
 
 
-class GetTodoListRequest(BaseModel):
+class GetTodoListRequest(RequestModel):
     """Request parameters for getting todo list.
 
     @property includeCompleted - Whether to include completed todos.
@@ -547,7 +568,7 @@ class GetTodoListRequest(BaseModel):
     include_completed: bool = Field(default=False)
 
 
-class GetDiaryListRequest(BaseModel):
+class GetDiaryListRequest(RequestModel):
     """Request parameters for getting diary list.
 
     @property limit - Maximum number of diaries to return (1-100).
@@ -556,7 +577,7 @@ class GetDiaryListRequest(BaseModel):
     limit: int = Field(default=10, ge=1, le=100)
 
 
-class ScheduleTodoRequest(BaseModel):
+class ScheduleTodoRequest(RequestModel):
     """Request parameters for scheduling a todo to a specific date.
 
     @property todoId - The todo ID to schedule.
@@ -566,20 +587,20 @@ class ScheduleTodoRequest(BaseModel):
     @property recurrenceRule - Optional recurrence configuration (dict with type and interval).
     """
 
-    todo_id: str = Field(..., min_length=1)
-    scheduled_date: str = Field(..., pattern=r"^\d{4}-\d{2}-\d{2}$")
-    scheduled_time: str | None = Field(None, pattern=r"^\d{2}:\d{2}$")
-    scheduled_end_time: str | None = Field(None, pattern=r"^\d{2}:\d{2}$")
+    todo_id: NonEmptyStr
+    scheduled_date: DateStr
+    scheduled_time: TimeStr | None = None
+    scheduled_end_time: TimeStr | None = None
     recurrence_rule: dict | None = None
 
 
-class UnscheduleTodoRequest(BaseModel):
+class UnscheduleTodoRequest(RequestModel):
     """Request parameters for unscheduling a todo.
 
     @property todoId - The todo ID to unschedule.
     """
 
-    todo_id: str = Field(..., min_length=1)
+    todo_id: NonEmptyStr
 
 
 # ============================================================================
@@ -587,45 +608,20 @@ class UnscheduleTodoRequest(BaseModel):
 # ============================================================================
 
 
-class DeleteActivitiesByDateRequest(BaseModel):
-    """Request parameters for deleting activities in a date range.
-
-    @property startDate - Start date in YYYY-MM-DD format.
-    @property endDate - End date in YYYY-MM-DD format.
-    """
-
-    start_date: str = Field(..., pattern=r"^\d{4}-\d{2}-\d{2}$")
-    end_date: str = Field(..., pattern=r"^\d{4}-\d{2}-\d{2}$")
-
-
-class DeleteKnowledgeByDateRequest(BaseModel):
-    """Request parameters for deleting knowledge in a date range.
-
-    @property startDate - Start date in YYYY-MM-DD format.
-    @property endDate - End date in YYYY-MM-DD format.
-    """
-
-    start_date: str = Field(..., pattern=r"^\d{4}-\d{2}-\d{2}$")
-    end_date: str = Field(..., pattern=r"^\d{4}-\d{2}-\d{2}$")
-
-
-class DeleteTodosByDateRequest(BaseModel):
-    """Request parameters for deleting todos in a date range.
+class DeleteByDateRangeRequest(RequestModel):
+    """Request parameters for deleting items (activities/knowledge/todos/diaries) in a date range.
 
     @property startDate - Start date in YYYY-MM-DD format.
     @property endDate - End date in YYYY-MM-DD format.
     """
 
-    start_date: str = Field(..., pattern=r"^\d{4}-\d{2}-\d{2}$")
-    end_date: str = Field(..., pattern=r"^\d{4}-\d{2}-\d{2}$")
+    start_date: DateStr
+    end_date: DateStr
 
 
-class DeleteDiariesByDateRequest(BaseModel):
-    """Request parameters for deleting diaries in a date range.
-
-    @property startDate - Start date in YYYY-MM-DD format.
-    @property endDate - End date in YYYY-MM-DD format.
-    """
-
-    start_date: str = Field(..., pattern=r"^\d{4}-\d{2}-\d{2}$")
-    end_date: str = Field(..., pattern=r"^\d{4}-\d{2}-\d{2}$")
+# All batch deletes take the same payload, so they share a single model
+# (and a single compiled validator/serializer) instead of four copies.
+DeleteActivitiesByDateRequest = DeleteByDateRangeRequest
+DeleteKnowledgeByDateRequest = DeleteByDateRangeRequest
+DeleteTodosByDateRequest = DeleteByDateRangeRequest
+DeleteDiariesByDateRequest = DeleteByDateRangeRequest
@@ -11,14 +11,24 @@ Main components:
 
 from .manager import PerceptionManager
 from .factory import MonitorFactory, create_keyboard_monitor, create_mouse_monitor
-from .base import BaseCapture, BaseKeyboardMonitor, BaseMouseMonitor
+from .base import (
+    BaseCapture,
+    BaseEventListener,
+    BaseInputCapture,
+    BaseKeyboardMonitor,
+    BaseMonitor,
+    BaseMouseMonitor,
+)
 
 __all__ = [
     "PerceptionManager",
     "MonitorFactory",
     "create_keyboard_monitor",
     "create_mouse_monitor",
+    "BaseMonitor",
+    "BaseEventListener",
     "BaseCapture",
+    "BaseInputCapture",
     "BaseKeyboardMonitor",
     "BaseMouseMonitor",
 ]
@@ -9,22 +9,49 @@ Design Pattern: Factory Pattern
 """
 
 import sys
-from typing import Optional, Callable
+from typing import Callable, Optional, Type
 from core.logger import get_logger
 from core.models import RawRecord
 
 from .base import BaseKeyboardMonitor, BaseMouseMonitor
-from .platforms import (
-    MacOSKeyboardMonitor,
-    MacOSMouseMonitor,
-    WindowsKeyboardMonitor,
-    WindowsMouseMonitor,
-    LinuxKeyboardMonitor,
-    LinuxMouseMonitor,
-)
 
 logger = get_logger(__name__)
 
+# Resolve the platform implementations once at import time instead of
+# re-running the platform checks on every factory call. Only the current
+# platform's package is imported, so other platforms' dependencies
+# (pynput backends, PyObjC, pywin32) are never loaded.
+_PLATFORM = sys.platform
+
+_KEYBOARD_MONITOR_CLS: Type[BaseKeyboardMonitor]
+_MOUSE_MONITOR_CLS: Type[BaseMouseMonitor]
+
+if _PLATFORM == "darwin":
+    # Keyboard: PyObjC NSEvent (avoids pynput TSM crashes), mouse: pynput
+    from .platforms.macos import MacOSKeyboardMonitor, MacOSMouseMonitor
+
+    _KEYBOARD_MONITOR_CLS = MacOSKeyboardMonitor
+    _MOUSE_MONITOR_CLS = MacOSMouseMonitor
+elif _PLATFORM == "win32":
+    from .platforms.windows import WindowsKeyboardMonitor, WindowsMouseMonitor
+
+    _KEYBOARD_MONITOR_CLS = WindowsKeyboardMonitor
+    _MOUSE_MONITOR_CLS = WindowsMouseMonitor
+else:
+    if not _PLATFORM.startswith("linux"):
+        logger.warning(
+            f"Unknown platform: {_PLATFORM}, using Linux implementation as default"
+        )
+    from .platforms.linux import LinuxKeyboardMonitor, LinuxMouseMonitor
+
+    _KEYBOARD_MONITOR_CLS = LinuxKeyboardMonitor
+    _MOUSE_MONITOR_CLS = LinuxMouseMonitor
+
+logger.debug(
+    f"Selected monitors for {_PLATFORM}: "
+    f"{_KEYBOARD_MONITOR_CLS.__name__}, {_MOUSE_MONITOR_CLS.__name__}"
+)
+
 
 class MonitorFactory:
     """Monitor factory class"""
@@ -36,7 +63,7 @@ class MonitorFactory:
         Returns:
             str: 'darwin' (macOS), 'win32' (Windows), 'linux' (Linux)
         """
-        return sys.platform
+        return _PLATFORM
 
     @staticmethod
     def create_keyboard_monitor(
@@ -44,7 +71,7 @@ class MonitorFactory:
     ) -> BaseKeyboardMonitor:
         """Create keyboard monitor
 
-        Automatically selects appropriate implementation based on current platform:
+        Uses the implementation selected for the current platform at import:
         - macOS: PyObjC NSEvent (avoids pynput TSM crashes)
         - Windows: pynput (extendable to Windows API)
         - Linux: pynput (extendable to X11/evdev)
@@ -55,25 +82,7 @@ class MonitorFactory:
         Returns:
             BaseKeyboardMonitor: Keyboard monitor instance
         """
-        platform = MonitorFactory.get_platform()
-
-        if platform == "darwin":
-            logger.debug("Creating macOS keyboard monitor (PyObjC NSEvent)")
-            return MacOSKeyboardMonitor(on_event)
-
-        elif platform == "win32":
-            logger.debug("Creating Windows keyboard monitor (pynput)")
-            return WindowsKeyboardMonitor(on_event)
-
-        elif platform.startswith("linux"):
-            logger.debug("Creating Linux keyboard monitor (pynput)")
-            return LinuxKeyboardMonitor(on_event)
-
-        else:
-            logger.warning(
-                f"Unknown platform: {platform}, using Linux implementation as default"
-            )
-            return LinuxKeyboardMonitor(on_event)
+        return _KEYBOARD_MONITOR_CLS(on_event)
 
     @staticmethod
     def create_mouse_monitor(
@@ -81,7 +90,7 @@ class MonitorFactory:
     ) -> BaseMouseMonitor:
         """Create mouse monitor
 
-        Automatically select appropriate implementation based on current platform:
+        Uses the implementation selected for the current platform at import:
         - macOS: pynput (mouse listening is safe on macOS)
         - Windows: pynput (extendable to Windows API)
         - Linux: pynput (extendable to X11/evdev)
@@ -92,25 +101,7 @@ class MonitorFactory:
         Returns:
             BaseMouseMonitor: Mouse monitor instance
         """
-        platform = MonitorFactory.get_platform()
-
-        if platform == "darwin":
-            logger.debug("Creating macOS mouse monitor (pynput)")
-            return MacOSMouseMonitor(on_event)
-
-        elif platform == "win32":
-            logger.debug("Creating Windows mouse monitor (pynput)")
-            return WindowsMouseMonitor(on_event)
-
-        elif platform.startswith("linux"):
-            logger.debug("Creating Linux mouse monitor (pynput)")
-            return LinuxMouseMonitor(on_event)
-
-        else:
-            logger.warning(
-                f"Unknown platform: {platform}, using Linux implementation as default"
-            )
-            return LinuxMouseMonitor(on_event)
+        return _MOUSE_MONITOR_CLS(on_event)
 
 
 # Convenience functions
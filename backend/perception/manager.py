@@ -6,11 +6,15 @@ Uses factory pattern to create platform-specific monitors
 """
 
 import asyncio
+import inspect
+import logging
+import threading
 from datetime import datetime
+from time import monotonic, perf_counter
 from typing import Any, Callable, Dict, Optional
 
 from core.logger import get_logger
-from core.models import RawRecord
+from core.models import RawRecord, RecordType
 
 from .factory import create_keyboard_monitor, create_mouse_monitor
 from .screen_state_monitor import create_screen_state_monitor
@@ -19,6 +23,12 @@ from .storage import EventBuffer, SlidingWindowStorage
 
 logger = get_logger(__name__)
 
+# Lock/unlock notifications closer together than this are coalesced (seconds)
+_SCREEN_STATE_DEBOUNCE = 0.5
+
+# Record type value -> enum member, avoids Enum lookup per query
+_RECORD_TYPES: Dict[str, RecordType] = {t.value: t for t in RecordType}
+
 
 class PerceptionManager:
     """Perception layer manager"""
@@ -39,6 +49,8 @@ class PerceptionManager:
         """
         self.capture_interval = capture_interval
         self.window_size = window_size
+        # Event loop used to schedule coroutine callbacks; set in start()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         self.on_data_captured = on_data_captured
 
         # Use factory pattern to create platform-specific monitors
@@ -53,7 +65,19 @@ class PerceptionManager:
         # Running state
         self.is_running = False
         self.is_paused = False  # Pause state (when screen is off)
-        self.tasks: Dict[str, asyncio.Task] = {}
+        # Dedicated screenshot thread; the stop event wakes it immediately on
+        # stop, and it blocks on the resume event while perception is paused
+        self._screenshot_thread: Optional[threading.Thread] = None
+        self._screenshot_stop = threading.Event()
+        self._screenshot_resume = threading.Event()
+
+        # Periodic storage cleanup, scheduled on the event loop with call_later
+        self._cleanup_handle: Optional[asyncio.TimerHandle] = None
+
+        # Pending debounced screen lock/unlock transition
+        self._screen_state_handle: Optional[asyncio.TimerHandle] = None
+        # Transitions run on executor threads; this keeps them in order
+        self._screen_state_lock = threading.Lock()
 
         # Screen state monitor
         self.screen_state_monitor = create_screen_state_monitor(
@@ -64,13 +88,99 @@ class PerceptionManager:
         self.keyboard_enabled = True
         self.mouse_enabled = True
 
+        # Cached DEBUG check for the event callbacks; refreshed on start and
+        # on settings updates since the log level rarely changes at runtime
+        self._debug = logger.isEnabledFor(logging.DEBUG)
+
+    @property
+    def on_data_captured(self) -> Optional[Callable[[RawRecord], Any]]:
+        """Data capture callback function"""
+        return self._on_data_captured
+
+    @on_data_captured.setter
+    def on_data_captured(self, callback: Optional[Callable[[RawRecord], Any]]) -> None:
+        self._on_data_captured = callback
+        self._dispatch = self._make_dispatch(callback)
+
+    def _make_dispatch(
+        self, callback: Optional[Callable[[RawRecord], Any]]
+    ) -> Optional[Callable[[RawRecord], None]]:
+        """Resolve how records reach the callback once, not per event
+
+        Plain callables are invoked directly. Coroutine functions would only
+        return an un-awaited coroutine from the capture threads, so they are
+        scheduled on the manager's event loop instead.
+        """
+        if callback is None or not inspect.iscoroutinefunction(callback):
+            return callback
+
+        def dispatch(record: RawRecord) -> None:
+            loop = self._loop
+            if loop is not None and not loop.is_closed():
+                asyncio.run_coroutine_threadsafe(callback(record), loop)
+
+        return dispatch
+
     def _on_screen_lock(self) -> None:
         """Screen lock/system sleep callback"""
+        self._schedule_screen_state(self._apply_screen_lock)
+
+    def _on_screen_unlock(self) -> None:
+        """Screen unlock/system wake callback"""
+        self._schedule_screen_state(self._apply_screen_unlock)
+
+    def _schedule_screen_state(self, apply: Callable[[], None]) -> None:
+        """Hand a screen state transition to the event loop for debouncing
+
+        Called from the screen state monitor's thread.
+        """
         if not self.is_running:
             return
 
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            self._apply_screen_state(apply)
+            return
+        loop.call_soon_threadsafe(self._debounce_screen_state, apply)
+
+    def _debounce_screen_state(self, apply: Callable[[], None]) -> None:
+        """Apply only the last transition of a lock/unlock burst
+
+        A lock followed by an unlock within the debounce window cancels the
+        pending lock, and the unlock is then a no-op, so the capturers are
+        not stopped and restarted.
+        """
+        if self._screen_state_handle is not None:
+            self._screen_state_handle.cancel()
+        self._screen_state_handle = asyncio.get_running_loop().call_later(
+            _SCREEN_STATE_DEBOUNCE, self._run_screen_state, apply
+        )
+
+    def _run_screen_state(self, apply: Callable[[], None]) -> None:
+        """Run a debounced screen state transition
+
+        Stopping and starting the capturers joins listener threads, which can
+        take seconds, so only the debounce timer lives on the event loop and
+        the transition itself runs on an executor thread.
+        """
+        self._screen_state_handle = None
+        asyncio.get_running_loop().run_in_executor(
+            None, self._apply_screen_state, apply
+        )
+
+    def _apply_screen_state(self, apply: Callable[[], None]) -> None:
+        """Apply a screen state transition, one at a time"""
+        with self._screen_state_lock:
+            apply()
+
+    def _apply_screen_lock(self) -> None:
+        """Pause perception after the screen locked/system slept"""
+        if not self.is_running or self.is_paused:
+            return
+
         logger.debug("Screen locked/system sleeping, pausing perception")
         self.is_paused = True
+        self._screenshot_resume.clear()
 
         # Pause each capturer
         try:
@@ -83,13 +193,14 @@ class PerceptionManager:
         except Exception as e:
             logger.error(f"Failed to pause capturers: {e}")
 
-    def _on_screen_unlock(self) -> None:
-        """Screen unlock/system wake callback"""
+    def _apply_screen_unlock(self) -> None:
+        """Resume perception after the screen unlocked/system woke up"""
         if not self.is_running or not self.is_paused:
             return
 
         logger.debug("Screen unlocked/system woke up, resuming perception")
         self.is_paused = False
+        self._screenshot_resume.set()
 
         # Resume each capturer
         try:
@@ -108,17 +219,21 @@ class PerceptionManager:
         if not self.is_running or self.is_paused:
             return
 
+        # The try block is free when nothing raises; it keeps a failing
+        # consumer from propagating into (and stopping) the listener thread
         try:
             # Record all keyboard events for subsequent processing to preserve usage context
             self.storage.add_record(record)
             self.event_buffer.add(record)
 
-            if self.on_data_captured:
-                self.on_data_captured(record)
+            dispatch = self._dispatch
+            if dispatch:
+                dispatch(record)
 
-            logger.debug(
-                f"Keyboard event recorded: {record.data.get('key', 'unknown')}"
-            )
+            if self._debug:
+                logger.debug(
+                    f"Keyboard event recorded: {record.data.get('key', 'unknown')}"
+                )
         except Exception as e:
             logger.error(f"Failed to process keyboard event: {e}")
 
@@ -134,12 +249,14 @@ class PerceptionManager:
                 self.storage.add_record(record)
                 self.event_buffer.add(record)
 
-                if self.on_data_captured:
-                    self.on_data_captured(record)
+                dispatch = self._dispatch
+                if dispatch:
+                    dispatch(record)
 
-                logger.debug(
-                    f"Mouse event recorded: {record.data.get('action', 'unknown')}"
-                )
+                if self._debug:
+                    logger.debug(
+                        f"Mouse event recorded: {record.data.get('action', 'unknown')}"
+                    )
         except Exception as e:
             logger.error(f"Failed to process mouse event: {e}")
 
@@ -154,25 +271,28 @@ class PerceptionManager:
                 self.storage.add_record(record)
                 self.event_buffer.add(record)
 
-                if self.on_data_captured:
-                    self.on_data_captured(record)
+                dispatch = self._dispatch
+                if dispatch:
+                    dispatch(record)
 
-                logger.debug(
-                    f"Screenshot recorded: {record.data.get('width', 0)}x{record.data.get('height', 0)}"
-                )
+                if self._debug:
+                    logger.debug(
+                        f"Screenshot recorded: {record.data.get('width', 0)}x{record.data.get('height', 0)}"
+                    )
         except Exception as e:
             logger.error(f"Failed to process screenshot event: {e}")
 
     async def start(self) -> None:
         """Start perception manager"""
-        from datetime import datetime
-
         if self.is_running:
             logger.warning("Perception manager is already running")
             return
 
         try:
-            start_total = datetime.now()
+            # Startup timings are only reported at DEBUG level
+            debug = self._debug = logger.isEnabledFor(logging.DEBUG)
+            start_total = perf_counter() if debug else 0.0
+            self._loop = asyncio.get_running_loop()
             self.is_running = True
             self.is_paused = False
 
@@ -184,49 +304,66 @@ class PerceptionManager:
             self.mouse_enabled = settings.get("perception.mouse_enabled", True)
 
             # Start screen state monitor
-            start_time = datetime.now()
+            start_time = perf_counter() if debug else 0.0
             self.screen_state_monitor.start()
-            logger.debug(
-                f"Screen state monitor startup time: {(datetime.now() - start_time).total_seconds():.3f}s"
-            )
+            if debug:
+                logger.debug(
+                    f"Screen state monitor startup time: {perf_counter() - start_time:.3f}s"
+                )
 
             # Start each capturer based on settings
             if self.keyboard_enabled:
-                start_time = datetime.now()
+                start_time = perf_counter() if debug else 0.0
                 self.keyboard_capture.start()
-                logger.debug(
-                    f"Keyboard capture startup time: {(datetime.now() - start_time).total_seconds():.3f}s"
-                )
+                if debug:
+                    logger.debug(
+                        f"Keyboard capture startup time: {perf_counter() - start_time:.3f}s"
+                    )
             else:
                 logger.debug("Keyboard perception is disabled")
 
             if self.mouse_enabled:
-                start_time = datetime.now()
+                start_time = perf_counter() if debug else 0.0
                 self.mouse_capture.start()
-                logger.debug(
-                    f"Mouse capture startup time: {(datetime.now() - start_time).total_seconds():.3f}s"
-                )
+                if debug:
+                    logger.debug(
+                        f"Mouse capture startup time: {perf_counter() - start_time:.3f}s"
+                    )
             else:
                 logger.debug("Mouse perception is disabled")
 
-            start_time = datetime.now()
+            start_time = perf_counter() if debug else 0.0
             self.screenshot_capture.start()
-            logger.debug(
-                f"Screenshot capture startup time: {(datetime.now() - start_time).total_seconds():.3f}s"
-            )
-
-            # Start async tasks
-            start_time = datetime.now()
-            self.tasks["screenshot_task"] = asyncio.create_task(self._screenshot_loop())
-            self.tasks["cleanup_task"] = asyncio.create_task(self._cleanup_loop())
-            logger.debug(
-                f"Async task creation time: {(datetime.now() - start_time).total_seconds():.3f}s"
-            )
+            if debug:
+                logger.debug(
+                    f"Screenshot capture startup time: {perf_counter() - start_time:.3f}s"
+                )
 
-            total_elapsed = (datetime.now() - start_total).total_seconds()
-            logger.debug(
-                f"Perception manager started (total time: {total_elapsed:.3f}s, keyboard: {self.keyboard_enabled}, mouse: {self.mouse_enabled})"
+            # Start screenshot thread and schedule cleanup
+            start_time = perf_counter() if debug else 0.0
+            previous_thread = self._screenshot_thread
+            if previous_thread is not None and not previous_thread.is_alive():
+                previous_thread = None
+            # Fresh events per thread: a straggler keeps its own set stop event
+            self._screenshot_stop = threading.Event()
+            self._screenshot_resume = threading.Event()
+            self._screenshot_resume.set()
+            self._screenshot_thread = threading.Thread(
+                target=self._screenshot_thread_run,
+                args=(previous_thread,),
+                name="ScreenshotCapture",
+                daemon=True,
             )
+            self._screenshot_thread.start()
+            # First cleanup delay 30 seconds (leave time for initialization)
+            self._schedule_cleanup(30)
+            if debug:
+                logger.debug(
+                    f"Background task startup time: {perf_counter() - start_time:.3f}s"
+                )
+                logger.debug(
+                    f"Perception manager started (total time: {perf_counter() - start_total:.3f}s, keyboard: {self.keyboard_enabled}, mouse: {self.mouse_enabled})"
+                )
 
         except Exception as e:
             logger.error(f"Failed to start perception manager: {e}")
@@ -245,79 +382,105 @@ class PerceptionManager:
             # Stop screen state monitor
             self.screen_state_monitor.stop()
 
-            # Stop all capturers based on what was enabled
-            if self.keyboard_enabled:
-                self.keyboard_capture.stop()
-            if self.mouse_enabled:
-                self.mouse_capture.stop()
-            self.screenshot_capture.stop()
-
-            # Cancel async tasks with timeout protection
-            for task_name, task in self.tasks.items():
-                if not task.done():
-                    task.cancel()
-                    try:
-                        # Add timeout to avoid hanging on tasks stuck in thread pool
-                        # (e.g., screenshot capture via run_in_executor)
-                        await asyncio.wait_for(task, timeout=2.0)
-                    except asyncio.TimeoutError:
-                        logger.warning(
-                            f"Task {task_name} did not finish within 2s timeout, forcing stop"
-                        )
-                    except asyncio.CancelledError:
-                        pass
-
-            self.tasks.clear()
+            # Wait out an in-flight lock/unlock transition so it cannot
+            # restart capturers behind our back
+            await asyncio.to_thread(self._screen_state_lock.acquire)
+            try:
+                # Stop all capturers based on what was enabled
+                if self.keyboard_enabled:
+                    self.keyboard_capture.stop()
+                if self.mouse_enabled:
+                    self.mouse_capture.stop()
+                self.screenshot_capture.stop()
+            finally:
+                self._screen_state_lock.release()
+
+            # Wake the screenshot thread and wait for an in-flight capture to finish
+            self._screenshot_stop.set()
+            self._screenshot_resume.set()
+            screenshot_thread = self._screenshot_thread
+            if screenshot_thread is not None and screenshot_thread.is_alive():
+                await asyncio.to_thread(screenshot_thread.join, 2.0)
+                if screenshot_thread.is_alive():
+                    # Keep the handle so start() waits for it instead of racing
+                    logger.warning(
+                        "Screenshot thread did not finish within 2s timeout, "
+                        "it will exit after the current capture"
+                    )
+            if screenshot_thread is not None and not screenshot_thread.is_alive():
+                self._screenshot_thread = None
+
+            if self._cleanup_handle is not None:
+                self._cleanup_handle.cancel()
+                self._cleanup_handle = None
+            if self._screen_state_handle is not None:
+                self._screen_state_handle.cancel()
+                self._screen_state_handle = None
 
             logger.debug("Perception manager stopped")
 
         except Exception as e:
             logger.error(f"Failed to stop perception manager: {e}")
 
-    async def _screenshot_loop(self) -> None:
-        """Screenshot loop task"""
+    def _screenshot_thread_run(
+        self, previous_thread: Optional[threading.Thread] = None
+    ) -> None:
+        """Screenshot capture thread
+
+        Captures run synchronously on this thread and records are delivered
+        through the screenshot callback, so the event loop is never involved.
+        Captures are paced against monotonic deadlines, so the cadence follows
+        capture_interval exactly instead of being rounded up to a poll period.
+        While perception is paused the thread sleeps until resume or stop.
+
+        Args:
+            previous_thread: The last run's thread if it outlived stop(); it is
+                waited for first so two threads never share the capturer
+        """
+        stop_event = self._screenshot_stop
+        resume_event = self._screenshot_resume
+        if previous_thread is not None:
+            logger.debug("Waiting for the previous screenshot thread to exit")
+            previous_thread.join()
+        next_deadline = monotonic()
         try:
-            loop = asyncio.get_event_loop()
-            while self.is_running:
-                # Execute synchronous screenshot operation in thread pool to avoid blocking event loop
-                await loop.run_in_executor(
-                    None,
-                    self.screenshot_capture.capture_with_interval,
-                    self.capture_interval,
-                )
-                await asyncio.sleep(0.1)  # Brief sleep to avoid excessive CPU usage
-        except asyncio.CancelledError:
-            logger.debug("Screenshot loop task cancelled")
+            while self.is_running and not stop_event.is_set():
+                if not resume_event.is_set():
+                    resume_event.wait()
+                    next_deadline = monotonic()
+                    continue
+
+                self.screenshot_capture.capture_once()
+
+                next_deadline += self.capture_interval
+                now = monotonic()
+                if next_deadline < now:
+                    # Capture overran the interval; skip ahead instead of bursting
+                    next_deadline = now
+                stop_event.wait(next_deadline - now)
         except Exception as e:
-            logger.error(f"Screenshot loop task failed: {e}")
+            logger.error(f"Screenshot thread failed: {e}")
+        logger.debug("Screenshot thread exited")
+
+    def _schedule_cleanup(self, delay: float) -> None:
+        """Schedule the next storage cleanup on the running event loop"""
+        loop = asyncio.get_running_loop()
+        self._cleanup_handle = loop.call_later(delay, self._cleanup_once)
+
+    def _cleanup_once(self) -> None:
+        """Cleanup expired records, then reschedule every 60 seconds"""
+        self._cleanup_handle = None
+        if not self.is_running:
+            return
 
-    async def _cleanup_loop(self) -> None:
-        """Cleanup loop task"""
         try:
-            # First cleanup delay 30 seconds (leave time for initialization)
-            cleanup_interval = 30
-            first_cleanup = True
-
-            while self.is_running:
-                await asyncio.sleep(cleanup_interval)
-
-                if not self.is_running:
-                    break
-
-                # After first cleanup, change to cleanup every 60 seconds
-                if first_cleanup:
-                    first_cleanup = False
-                    cleanup_interval = 60
-
-                try:
-                    self.storage._cleanup_expired_records()
-                    logger.debug("Performing periodic cleanup")
-                except Exception as e:
-                    logger.error(f"Failed to cleanup expired records: {e}")
-        except asyncio.CancelledError:
-            logger.debug("Cleanup loop task cancelled")
+            self.storage.cleanup_expired_records()
+            logger.debug("Performing periodic cleanup")
         except Exception as e:
-            logger.error(f"Cleanup loop task failed: {e}")
+            logger.error(f"Failed to cleanup expired records: {e}")
+        finally:
+            if self.is_running:
+                self._schedule_cleanup(60)
 
     def get_recent_records(self, count: int = 100) -> list:
         """Get recent records"""
@@ -325,14 +488,11 @@ class PerceptionManager:
 
     def get_records_by_type(self, event_type: str) -> list:
         """Get records by type"""
-        from core.models import RecordType
-
-        try:
-            event_type_enum = RecordType(event_type)
-            return self.storage.get_records_by_type(event_type_enum)
-        except ValueError:
+        event_type_enum = _RECORD_TYPES.get(event_type)
+        if event_type_enum is None:
             logger.error(f"Invalid event type: {event_type}")
             return []
+        return self.storage.get_records_by_type(event_type_enum)
 
     def get_records_in_timeframe(
         self, start_time: datetime, end_time: datetime
@@ -342,11 +502,7 @@ class PerceptionManager:
 
     def get_records_in_last_n_seconds(self, seconds: int) -> list:
         """Get records from last N seconds"""
-        from datetime import datetime, timedelta
-
-        end_time = datetime.now()
-        start_time = end_time - timedelta(seconds=seconds)
-        return self.storage.get_records_in_timeframe(start_time, end_time)
+        return self.storage.get_records_in_last_n_seconds(seconds)
 
     def get_buffered_events(self) -> list:
         """Get events from buffer"""
@@ -373,12 +529,22 @@ class PerceptionManager:
                 "mouse": mouse_stats,
                 "screenshot": screenshot_stats,
                 "buffer_size": self.event_buffer.size(),
-                "active_tasks": len([t for t in self.tasks.values() if not t.done()]),
+                "active_tasks": self._active_task_count(),
             }
         except Exception as e:
             logger.error(f"Failed to get statistics: {e}")
             return {"error": str(e)}
 
+    def _active_task_count(self) -> int:
+        """Count running background workers (screenshot thread, cleanup timer)"""
+        count = 0
+        screenshot_thread = self._screenshot_thread
+        if screenshot_thread is not None and screenshot_thread.is_alive():
+            count += 1
+        if self._cleanup_handle is not None:
+            count += 1
+        return count
+
     def set_capture_interval(self, interval: float) -> None:
         """Set capture interval"""
         self.capture_interval = max(1, interval)  # Minimum interval 0.1 seconds
@@ -402,6 +568,7 @@ class PerceptionManager:
             mouse_enabled: Enable/disable mouse perception
         """
         was_running = self.is_running
+        self._debug = logger.isEnabledFor(logging.DEBUG)
 
         if keyboard_enabled is not None and keyboard_enabled != self.keyboard_enabled:
             self.keyboard_enabled = keyboard_enabled
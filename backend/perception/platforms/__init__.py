@@ -1,15 +1,46 @@
 """
 Platform-specific implementation package
 Provides different keyboard, mouse, and screen state monitoring implementations based on operating system
+
+Platform packages are imported lazily on first attribute access, so importing
+this package does not pull in the dependencies of the other platforms.
 """
 
-from .linux import LinuxKeyboardMonitor, LinuxMouseMonitor, LinuxScreenStateMonitor
-from .macos import MacOSKeyboardMonitor, MacOSMouseMonitor, MacOSScreenStateMonitor
-from .windows import (
-    WindowsKeyboardMonitor,
-    WindowsMouseMonitor,
-    WindowsScreenStateMonitor,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .linux import LinuxKeyboardMonitor, LinuxMouseMonitor, LinuxScreenStateMonitor
+    from .macos import MacOSKeyboardMonitor, MacOSMouseMonitor, MacOSScreenStateMonitor
+    from .windows import (
+        WindowsKeyboardMonitor,
+        WindowsMouseMonitor,
+        WindowsScreenStateMonitor,
+    )
+
+# Exported name -> platform subpackage that defines it
+_LAZY_EXPORTS = {
+    "MacOSKeyboardMonitor": "macos",
+    "MacOSMouseMonitor": "macos",
+    "MacOSScreenStateMonitor": "macos",
+    "WindowsKeyboardMonitor": "windows",
+    "WindowsMouseMonitor": "windows",
+    "WindowsScreenStateMonitor": "windows",
+    "LinuxKeyboardMonitor": "linux",
+    "LinuxMouseMonitor": "linux",
+    "LinuxScreenStateMonitor": "linux",
+}
+
+
+def __getattr__(name: str) -> Any:
+    subpackage = _LAZY_EXPORTS.get(name)
+    if subpackage is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{subpackage}", __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "MacOSKeyboardMonitor",
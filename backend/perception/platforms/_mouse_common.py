@@ -0,0 +1,213 @@
+"""
+Helpers shared by the platform mouse monitors
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from core.logger import get_logger
+from core.models import RawRecord
+
+logger = get_logger(__name__)
+
+# Squared drag threshold (5px), compared without taking a square root
+DRAG_DISTANCE_SQ = 5 * 5
+
+# Squared minimum travel (3px) before another drag record is emitted
+DRAG_MIN_STEP_SQ = 3 * 3
+
+
+class ButtonNames(dict):
+    """Button -> name map filled on first use (only a handful of buttons exist)"""
+
+    def __missing__(self, button: Any) -> str:
+        name = self[button] = getattr(button, "name", None) or str(button)
+        return name
+
+
+BUTTON_NAMES = ButtonNames()
+
+
+class DragTracker:
+    """Tracks a held button and turns pointer travel into drag data
+
+    While the button is held, moves closer than 3px to the last drag point are
+    pointer jitter and report nothing, and a drag step is reported at most once
+    per `min_interval`. On release the press counts as a drag if it lasted
+    longer than `min_interval` and travelled more than 5px.
+    """
+
+    def __init__(self, min_interval: float = 0.1):
+        self.min_interval = min_interval
+        self.active = False  # Whether a button is held
+        self._start_pos: Optional[Tuple[int, int]] = None
+        self._start_time: float = 0
+
+    def press(self, current_time: float, x: int, y: int) -> None:
+        """A button went down at (x, y)"""
+        self.active = True
+        self._start_pos = (x, y)
+        self._start_time = current_time
+
+    def step(self, x: int, y: int) -> Optional[Dict[str, Any]]:
+        """Drag data for a move while the button is held, None if too small"""
+        start_pos = self._start_pos
+        if start_pos is None:
+            return None
+
+        # Pointer jitter while a button is held is not a drag step
+        dx = x - start_pos[0]
+        dy = y - start_pos[1]
+        if dx * dx + dy * dy < DRAG_MIN_STEP_SQ:
+            return None
+
+        current_time = time.monotonic()
+        duration = current_time - self._start_time
+        if duration <= self.min_interval:
+            return None
+
+        # The next step is measured from here to avoid duplicate records
+        self._start_pos = (x, y)
+        self._start_time = current_time
+        return {
+            "action": "drag",
+            "start_position": start_pos,
+            "current_position": (x, y),
+            "duration": duration,
+        }
+
+    def release(
+        self, current_time: float, x: int, y: int, button_name: str
+    ) -> Optional[Dict[str, Any]]:
+        """drag_end data if the press was a drag, None for a plain click"""
+        start_pos = self._start_pos
+        duration = current_time - self._start_time
+        self.active = False
+        self._start_pos = None
+
+        if start_pos is None or duration <= self.min_interval:
+            return None
+        dx = x - start_pos[0]
+        dy = y - start_pos[1]
+        if dx * dx + dy * dy <= DRAG_DISTANCE_SQ:
+            return None
+
+        return {
+            "action": "drag_end",
+            "button": button_name,
+            "start_position": start_pos,
+            "end_position": (x, y),
+            "duration": duration,
+        }
+
+
+def to_wall_time(mono_time: float) -> float:
+    """Convert a time.monotonic() reading to wall-clock seconds (0 stays 0)"""
+    if not mono_time:
+        return 0
+    return time.time() - (time.monotonic() - mono_time)
+
+
+class ScrollMerger:
+    """Merges consecutive scroll steps into one pending gesture record
+
+    Steps less than `timeout` apart are folded into the pending record, up to
+    `max_duration` per gesture. The gesture is output when the next one starts,
+    on flush(), or once scrolling has been idle for `timeout`, so a lone scroll
+    is not held back until the next mouse event. The idle check runs on one
+    long-lived flusher thread that sleeps on a condition until the gesture's
+    monotonic deadline; steps only move the deadline and never spawn threads.
+    """
+
+    def __init__(
+        self,
+        emit: Callable[[RawRecord], None],
+        timeout: float = 0.1,
+        max_duration: float = 1.0,
+    ):
+        self._emit = emit
+        self.timeout = timeout
+        self.max_duration = max_duration
+        self.last_time: float = 0  # time.monotonic() of the latest step
+        self._cond = threading.Condition()
+        self._pending: Optional[RawRecord] = None
+        self._started: float = 0
+        self._flusher: Optional[threading.Thread] = None
+
+    @property
+    def pending(self) -> bool:
+        return self._pending is not None
+
+    def merge(self, current_time: float, x: int, y: int, dx: int, dy: int) -> bool:
+        """Fold a step into the pending gesture; False if a new one must start"""
+        with self._cond:
+            pending = self._pending
+            if (
+                pending is None
+                or current_time - self.last_time >= self.timeout
+                or current_time - self._started > self.max_duration
+            ):
+                return False
+
+            data = pending.data
+            data["dy"] += dy
+            data["dx"] += dx
+            data["end_position"] = (x, y)
+            self.last_time = current_time
+            return True
+
+    def start(self, current_time: float, record: RawRecord) -> None:
+        """Begin a new gesture, outputting the previous one first"""
+        with self._cond:
+            finished = self._pending
+            self._pending = record
+            self._started = current_time
+            self.last_time = current_time
+            if self._flusher is None:
+                self._flusher = threading.Thread(
+                    target=self._flush_idle, name="ScrollFlusher", daemon=True
+                )
+                self._flusher.start()
+            elif finished is None:
+                # The flusher is parked without a deadline; give it one
+                self._cond.notify()
+
+        if finished is not None:
+            self._emit(finished)
+
+    def flush(self) -> None:
+        """Output the pending gesture now"""
+        with self._cond:
+            record = self._pending
+            self._pending = None
+
+        if record is not None:
+            self._emit(record)
+
+    def _flush_idle(self) -> None:
+        """Flusher thread: output each gesture once it has gone idle"""
+        while True:
+            with self._cond:
+                record = self._wait_idle()
+            try:
+                self._emit(record)
+            except Exception as e:
+                logger.error(f"Failed to output idle scroll gesture: {e}")
+
+    def _wait_idle(self) -> RawRecord:
+        """Block until the pending gesture has been idle for `timeout`
+
+        Must be called with the condition held.
+        """
+        while True:
+            if self._pending is None:
+                self._cond.wait()
+                continue
+
+            remaining = self.last_time + self.timeout - time.monotonic()
+            if remaining <= 0:
+                record = self._pending
+                self._pending = None
+                return record
+            self._cond.wait(remaining)
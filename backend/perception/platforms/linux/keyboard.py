@@ -18,6 +18,49 @@ logger = get_logger(__name__)
 class LinuxKeyboardMonitor(BaseKeyboardMonitor):
     """Linux keyboard event capturer (using pynput)"""
 
+    # Keys that are always worth recording, shared by all instances
+    _SPECIAL_KEYS = frozenset(
+        {
+            "enter",
+            "space",
+            "tab",
+            "backspace",
+            "delete",
+            "up",
+            "down",
+            "left",
+            "right",
+            "home",
+            "end",
+            "page_up",
+            "page_down",
+            "f1",
+            "f2",
+            "f3",
+            "f4",
+            "f5",
+            "f6",
+            "f7",
+            "f8",
+            "f9",
+            "f10",
+            "f11",
+            "f12",
+            "esc",
+            "caps_lock",
+            "num_lock",
+            "scroll_lock",
+            "insert",
+            "print_screen",
+            "pause",
+            "cmd",
+            "alt",
+            "ctrl",
+            "shift",
+            "super",  # Linux uses 'super' instead of Windows key
+        }
+    )
+
     def __init__(self, on_event: Optional[Callable[[RawRecord], None]] = None):
         super().__init__(on_event)
         self.listener: Optional[keyboard.Listener] = None
@@ -49,7 +92,8 @@ class LinuxKeyboardMonitor(BaseKeyboardMonitor):
         try:
             self.is_running = True
             self.listener = keyboard.Listener(
-                on_press=self._on_press, on_release=self._on_release
+                on_press=self._make_handler("press"),
+                on_release=self._make_handler("release"),
             )
             self.listener.start()
             logger.debug("✅ Linux keyboard listener started (using pynput)")
@@ -76,42 +120,38 @@ class LinuxKeyboardMonitor(BaseKeyboardMonitor):
             except Exception as e:
                 logger.error(f"Failed to stop Linux keyboard listener: {e}")
 
-    def _on_press(self, key):
-        """Handle key press event"""
-        if not self.is_running:
-            return
-
-        try:
-            key_data = self._extract_key_data(key, "press")
-            record = RawRecord(
-                timestamp=datetime.now(), type=RecordType.KEYBOARD_RECORD, data=key_data
-            )
-
-            if self.on_event:
-                self.on_event(record)
-
-        except Exception as e:
-            logger.error(f"Failed to handle key event: {e}")
+    def _make_handler(self, action: str) -> Callable[[Any], None]:
+        """Build the pynput callback for a key action ("press" or "release")
 
-    def _on_release(self, key):
-        """Handle key release event"""
-        if not self.is_running:
-            return
+        Errors are still caught per event: pynput stops the listener when a
+        callback raises, which would silently end keyboard capture.
+        """
+        # Resolve per-event lookups once; the closure reads them as cells
+        now_fn = datetime.now
+        extract_key_data = self._extract_key_data
+        record_type = RecordType.KEYBOARD_RECORD
 
-        try:
-            key_data = self._extract_key_data(key, "release")
-            record = RawRecord(
-                timestamp=datetime.now(), type=RecordType.KEYBOARD_RECORD, data=key_data
-            )
+        def handler(key) -> None:
+            if not self.is_running:
+                return
+            on_event = self.on_event
+            if on_event is None:
+                return
 
-            if self.on_event:
-                self.on_event(record)
+            try:
+                key_data = extract_key_data(key, action)
+                on_event(RawRecord(timestamp=now_fn(), type=record_type, data=key_data))
+            except Exception as e:
+                logger.error(f"Failed to handle key {action} event: {e}")
 
-        except Exception as e:
-            logger.error(f"Failed to handle key release event: {e}")
+        return handler
 
     def _extract_key_data(self, key, action: str) -> dict:
-        """Extract key data"""
+        """Extract key data
+
+        The event time lives on RawRecord.timestamp only; it is not
+        duplicated into the data dict.
+        """
         try:
             # Try to get character
             if hasattr(key, "char") and key.char is not None:
@@ -127,7 +167,6 @@ class LinuxKeyboardMonitor(BaseKeyboardMonitor):
                 "key_type": key_type,
                 "action": action,
                 "modifiers": [],  # pynput doesn't directly provide current modifier key state
-                "timestamp": datetime.now().isoformat(),
             }
         except Exception as e:
             logger.error(f"Failed to extract key data: {e}")
@@ -135,53 +174,12 @@ class LinuxKeyboardMonitor(BaseKeyboardMonitor):
                 "key": "unknown",
                 "action": action,
                 "modifiers": [],
-                "timestamp": datetime.now().isoformat(),
             }
 
     def is_special_key(self, key_data: dict) -> bool:
         """Determine if this is a special key (needs to be recorded)"""
-        special_keys = {
-            "enter",
-            "space",
-            "tab",
-            "backspace",
-            "delete",
-            "up",
-            "down",
-            "left",
-            "right",
-            "home",
-            "end",
-            "page_up",
-            "page_down",
-            "f1",
-            "f2",
-            "f3",
-            "f4",
-            "f5",
-            "f6",
-            "f7",
-            "f8",
-            "f9",
-            "f10",
-            "f11",
-            "f12",
-            "esc",
-            "caps_lock",
-            "num_lock",
-            "scroll_lock",
-            "insert",
-            "print_screen",
-            "pause",
-            "cmd",
-            "alt",
-            "ctrl",
-            "shift",
-            "super",  # Linux uses 'super' instead of Windows key
-        }
-
         key = key_data.get("key", "").lower()
-        return key in special_keys or key_data.get("key_type") == "special"
+        return key in self._SPECIAL_KEYS or key_data.get("key_type") == "special"
 
     def get_stats(self) -> Dict[str, Any]:
         """Get capture statistics"""
@@ -12,6 +12,12 @@ from typing import Any, Callable, Dict, Optional, Tuple
 from core.logger import get_logger
 from core.models import RawRecord, RecordType
 from perception.base import BaseMouseMonitor
+from perception.platforms._mouse_common import (
+    BUTTON_NAMES,
+    DragTracker,
+    ScrollMerger,
+    to_wall_time,
+)
 from pynput import mouse
 
 logger = get_logger(__name__)
@@ -24,14 +30,11 @@ class LinuxMouseMonitor(BaseMouseMonitor):
         super().__init__(on_event)
         self.listener: Optional[mouse.Listener] = None
         self._last_click_time: float = 0
-        self._last_scroll_time: float = 0
-        self._scroll_buffer = []
         self._click_timeout: float = 0.5
         self._scroll_timeout: float = 0.1
+        self._scroll = ScrollMerger(self._emit, timeout=self._scroll_timeout)
         self._last_position: Tuple[int, int] = (0, 0)
-        self._is_dragging: bool = False
-        self._drag_start_pos: Optional[Tuple[int, int]] = None
-        self._drag_start_time: Optional[float] = None
+        self._drag = DragTracker()
 
     def capture(self) -> RawRecord:
         """Capture mouse event (synchronous method, for testing)"""
@@ -48,10 +51,13 @@ class LinuxMouseMonitor(BaseMouseMonitor):
 
     def output(self) -> None:
         """Output processed data"""
-        if self.on_event and self._scroll_buffer:
-            for record in self._scroll_buffer:
-                self.on_event(record)
-        self._scroll_buffer.clear()
+        self._scroll.flush()
+
+    def _emit(self, record: RawRecord) -> None:
+        """Hand a finished record to the consumer"""
+        on_event = self.on_event
+        if on_event:
+            on_event(record)
 
     def start(self):
         """Start mouse listening"""
@@ -84,40 +90,29 @@ class LinuxMouseMonitor(BaseMouseMonitor):
                 logger.error(f"Failed to stop mouse listener: {e}")
                 self.listener = None
 
+        # Hand off a scroll gesture that was still being merged
+        self.output()
+
     def _on_move(self, x: int, y: int):
         """Handle mouse move event"""
         if not self.is_running:
             return
 
-        try:
-            self._last_position = (x, y)
-
-            if (
-                self._is_dragging
-                and self._drag_start_pos
-                and self._drag_start_time is not None
-            ):
-                current_time = time.time()
-                if current_time - self._drag_start_time > 0.1:
-                    drag_data = {
-                        "action": "drag",
-                        "start_position": self._drag_start_pos,
-                        "current_position": (x, y),
-                        "duration": current_time - self._drag_start_time,
-                        "timestamp": datetime.now().isoformat(),
-                    }
+        # Most moves happen without a button held; only track the position
+        self._last_position = (x, y)
+        if not self._drag.active:
+            return
 
-                    record = RawRecord(
+        try:
+            drag_data = self._drag.step(x, y)
+            if drag_data is not None:
+                self._emit(
+                    RawRecord(
                         timestamp=datetime.now(),
                         type=RecordType.MOUSE_RECORD,
                         data=drag_data,
                     )
-
-                    if self.on_event:
-                        self.on_event(record)
-
-                    self._drag_start_pos = (x, y)
-                    self._drag_start_time = current_time
+                )
 
         except Exception as e:
             logger.error(f"Failed to handle mouse move event: {e}")
@@ -128,49 +123,31 @@ class LinuxMouseMonitor(BaseMouseMonitor):
             return
 
         try:
-            current_time = time.time()
-            button_name = button.name if hasattr(button, "name") else str(button)
+            current_time = time.monotonic()
+            button_name = BUTTON_NAMES[button]
+
+            # Keep record order: a finished scroll gesture precedes this click
+            if self._scroll.pending:
+                self.output()
 
             if pressed:
                 self._last_click_time = current_time
-                self._is_dragging = True
-                self._drag_start_pos = (x, y)
-                self._drag_start_time = current_time
+                self._drag.press(current_time, x, y)
 
                 click_data = {
                     "action": "press",
                     "button": button_name,
                     "position": (x, y),
-                    "timestamp": datetime.now().isoformat(),
                 }
             else:
-                self._is_dragging = False
-
-                if (
-                    self._drag_start_pos
-                    and self._drag_start_time is not None
-                    and current_time - self._drag_start_time > 0.1
-                    and self._distance(self._drag_start_pos, (x, y)) > 5
-                ):
-                    click_data = {
-                        "action": "drag_end",
-                        "button": button_name,
-                        "start_position": self._drag_start_pos,
-                        "end_position": (x, y),
-                        "duration": current_time - self._drag_start_time,
-                        "timestamp": datetime.now().isoformat(),
-                    }
-                else:
+                click_data = self._drag.release(current_time, x, y, button_name)
+                if click_data is None:
                     click_data = {
                         "action": "release",
                         "button": button_name,
                         "position": (x, y),
-                        "timestamp": datetime.now().isoformat(),
                     }
 
-                self._drag_start_pos = None
-                self._drag_start_time = None
-
             record = RawRecord(
                 timestamp=datetime.now(), type=RecordType.MOUSE_RECORD, data=click_data
             )
@@ -187,49 +164,30 @@ class LinuxMouseMonitor(BaseMouseMonitor):
             return
 
         try:
-            current_time = time.time()
-
-            if (
-                current_time - self._last_scroll_time < self._scroll_timeout
-                and self._scroll_buffer
-            ):
-                last_record = self._scroll_buffer[-1]
-                last_data = last_record.data
-                last_data["dy"] += dy
-                last_data["dx"] += dx
-                last_data["end_position"] = (x, y)
-            else:
+            current_time = time.monotonic()
+
+            # Merge consecutive scroll events into the pending gesture
+            if not self._scroll.merge(current_time, x, y, dx, dy):
                 scroll_data = {
                     "action": "scroll",
                     "position": (x, y),
                     "dx": dx,
                     "dy": dy,
-                    "timestamp": datetime.now().isoformat(),
                 }
 
-                record = RawRecord(
-                    timestamp=datetime.now(),
-                    type=RecordType.MOUSE_RECORD,
-                    data=scroll_data,
+                # A new gesture starts; the previous one is output first
+                self._scroll.start(
+                    current_time,
+                    RawRecord(
+                        timestamp=datetime.now(),
+                        type=RecordType.MOUSE_RECORD,
+                        data=scroll_data,
+                    ),
                 )
 
-                self._scroll_buffer.append(record)
-
-            self._last_scroll_time = current_time
-
-            if (
-                len(self._scroll_buffer) >= 5
-                or current_time - self._last_scroll_time > 1.0
-            ):
-                self.output()
-
         except Exception as e:
             logger.error(f"Failed to handle mouse scroll event: {e}")
 
-    def _distance(self, pos1: Tuple[int, int], pos2: Tuple[int, int]) -> float:
-        """Calculate distance between two points"""
-        return ((pos1[0] - pos2[0]) ** 2 + (pos1[1] - pos2[1]) ** 2) ** 0.5
-
     def is_important_event(self, event_data: dict) -> bool:
         """Determine if this is an important event (needs to be recorded)"""
         action = event_data.get("action", "")
@@ -242,8 +200,8 @@ class LinuxMouseMonitor(BaseMouseMonitor):
             "platform": "Linux",
             "implementation": "pynput",
             "last_position": self._last_position,
-            "is_dragging": self._is_dragging,
-            "scroll_buffer_size": len(self._scroll_buffer),
-            "last_click_time": self._last_click_time,
-            "last_scroll_time": self._last_scroll_time,
+            "is_dragging": self._drag.active,
+            "pending_scroll": self._scroll.pending,
+            "last_click_time": to_wall_time(self._last_click_time),
+            "last_scroll_time": to_wall_time(self._scroll.last_time),
         }
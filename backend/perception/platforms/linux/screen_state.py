@@ -4,13 +4,28 @@ Linux screen state monitor implementation
 
 import threading
 from importlib import import_module
-from typing import Callable, Optional
+from typing import Any, Callable, Optional
 
 from core.logger import get_logger
 from perception.base import BaseEventListener
 
 logger = get_logger(__name__)
 
+# Resolve dbus/GLib once at import; start() only checks the flag
+dbus: Any = None
+DBusGMainLoop: Any = None
+GLib: Any = None
+_DBUS_IMPORT_ERROR: Optional[Exception] = None
+
+try:
+    dbus = import_module("dbus")
+    DBusGMainLoop = getattr(import_module("dbus.mainloop.glib"), "DBusGMainLoop")
+    GLib = getattr(import_module("gi.repository"), "GLib")
+    DBUS_AVAILABLE = True
+except Exception as exc:
+    DBUS_AVAILABLE = False
+    _DBUS_IMPORT_ERROR = exc
+
 
 class LinuxScreenStateMonitor(BaseEventListener):
     """Linux screen state monitor"""
@@ -31,20 +46,26 @@ class LinuxScreenStateMonitor(BaseEventListener):
         self.on_screen_lock = on_screen_lock
         self.on_screen_unlock = on_screen_unlock
         self._thread: Optional[threading.Thread] = None
+        self._loop: Any = None
 
     def start(self) -> None:
         """Start listening"""
         if self.is_running:
             return
 
-        try:
-            # Try to use dbus to listen for logind signals
-            import_module("dbus")
-            dbus_glib = import_module("dbus.mainloop.glib")
-            DBusGMainLoop = getattr(dbus_glib, "DBusGMainLoop")
+        if not DBUS_AVAILABLE:
+            logger.warning(
+                "Cannot import dbus dependencies (%s), screen state monitor unavailable",
+                _DBUS_IMPORT_ERROR,
+            )
+            return
 
+        try:
+            # Use dbus to listen for logind signals
             DBusGMainLoop(set_as_default=True)
 
+            # Created here so stop() can always reach the loop it must quit
+            self._loop = GLib.MainLoop()
             self.is_running = True
 
             # Run DBus main loop in background thread
@@ -53,44 +74,35 @@ class LinuxScreenStateMonitor(BaseEventListener):
 
             logger.debug("Linux screen state monitor started")
 
-        except ModuleNotFoundError as exc:
-            logger.warning(
-                "Cannot import dbus dependencies (%s), screen state monitor unavailable",
-                exc,
-            )
-            self.is_running = False
         except Exception as e:
             logger.error(f"Failed to start Linux screen state monitor: {e}")
             self.is_running = False
 
     def _dbus_loop(self) -> None:
         """DBus main loop"""
+        loop = self._loop
         try:
-            dbus = import_module("dbus")
-            gi_repository = import_module("gi.repository")
-            GLib = getattr(gi_repository, "GLib")
+            bus = dbus.SystemBus()
 
-            system_bus = getattr(dbus, "SystemBus")
-            bus = system_bus()
-
-            # Listen for PrepareForSleep signal
-            bus.add_signal_receiver(
+            # Listen for PrepareForSleep signal. The receiver installs a match
+            # rule on the bus, so the broker filters all other traffic before
+            # this process is woken
+            receiver = bus.add_signal_receiver(
                 self._handle_prepare_for_sleep,
                 "PrepareForSleep",
                 "org.freedesktop.login1.Manager",
                 "org.freedesktop.login1",
+                "/org/freedesktop/login1",
             )
 
-            # Run main loop
-            loop = GLib.MainLoop()
-            while self.is_running:
-                loop.get_context().iteration(False)
-                threading.Event().wait(0.1)
+            # Block in GLib's poll until a signal arrives or stop() quits the loop
+            try:
+                loop.run()
+            finally:
+                # The system bus connection is shared; drop the receiver so a
+                # restart does not deliver each signal twice
+                receiver.remove()
 
-        except ModuleNotFoundError as exc:
-            logger.warning(
-                "Missing dbus/gi dependencies for screen state monitor: %s", exc
-            )
         except Exception as e:
             logger.error(f"Linux DBus loop exception: {e}")
 
@@ -112,6 +124,12 @@ class LinuxScreenStateMonitor(BaseEventListener):
 
         self.is_running = False
 
+        # Quit via an idle callback: thread-safe, and still honored if the
+        # loop has not entered run() yet
+        if self._loop is not None:
+            GLib.idle_add(self._loop.quit)
+            self._loop = None
+
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=2.0)
 
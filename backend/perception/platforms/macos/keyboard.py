@@ -9,15 +9,17 @@ instead of pynput, to avoid TSMGetInputSourceProperty crashes in background thre
 Notes:
 1. Need to grant accessibility permissions in System Preferences -> Security & Privacy -> Accessibility
 2. NSEvent monitor runs in macOS main event loop, avoiding thread conflicts
-3. Use thread-safe queue to pass events between Cocoa and Python async code
+3. Events are merged and forwarded directly in the NSEvent handler; the work is
+   light enough that no hand-off thread is needed
 """
 
 import sys
 import threading
+import time
+from collections import deque
 from datetime import datetime
 from importlib import import_module
-from queue import Queue
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Deque, Dict, Optional
 
 from core.logger import get_logger
 from core.models import RawRecord, RecordType
@@ -48,18 +50,126 @@ if sys.platform == "darwin":
 else:
     PYOBJC_AVAILABLE = False
 
+# NSEvent type -> action
+_NS_KEY_DOWN = 10
+_NS_KEY_UP = 11
+_NS_FLAGS_CHANGED = 12
+_ACTION_MAP = {
+    _NS_KEY_DOWN: "press",
+    _NS_KEY_UP: "release",
+    _NS_FLAGS_CHANGED: "modifier",
+}
+
+# NSEvent modifier flag bits, in reporting order
+_MODIFIER_MASKS = (
+    (1 << 20, "cmd"),  # NSCommandKeyMask
+    (1 << 19, "alt"),  # NSAlternateKeyMask
+    (1 << 17, "shift"),  # NSShiftKeyMask
+    (1 << 18, "ctrl"),  # NSControlKeyMask
+)
+_ALL_MODIFIERS_MASK = (1 << 20) | (1 << 19) | (1 << 17) | (1 << 18)
+_NS_CAPS_LOCK_KEY_MASK = 1 << 16
+
+
+class _SpecialKeyNames(dict):
+    """Key code -> name map that caches the fallback name of unknown codes"""
+
+    def __missing__(self, key_code: int) -> str:
+        name = self[key_code] = sys.intern(f"key_{key_code}")
+        return name
+
+
+# macOS key code mapping (common special keys)
+_SPECIAL_KEY_NAMES = _SpecialKeyNames(
+    {
+        36: "enter",
+        49: "space",
+        48: "tab",
+        51: "backspace",
+        53: "esc",
+        117: "delete",
+        122: "f1",
+        120: "f2",
+        99: "f3",
+        118: "f4",
+        96: "f5",
+        97: "f6",
+        98: "f7",
+        100: "f8",
+        101: "f9",
+        109: "f10",
+        103: "f11",
+        111: "f12",
+        123: "left",
+        124: "right",
+        125: "down",
+        126: "up",
+        115: "home",
+        119: "end",
+        116: "page_up",
+        121: "page_down",
+    }
+)
+
 
 class MacOSKeyboardMonitor(BaseKeyboardMonitor):
     """macOS keyboard event capturer (using PyObjC)"""
 
+    # Keys that are always worth recording, shared by all instances
+    _SPECIAL_KEYS = frozenset(
+        {
+            "enter",
+            "space",
+            "tab",
+            "backspace",
+            "delete",
+            "up",
+            "down",
+            "left",
+            "right",
+            "home",
+            "end",
+            "page_up",
+            "page_down",
+            "f1",
+            "f2",
+            "f3",
+            "f4",
+            "f5",
+            "f6",
+            "f7",
+            "f8",
+            "f9",
+            "f10",
+            "f11",
+            "f12",
+            "esc",
+            "caps_lock",
+            "num_lock",
+            "scroll_lock",
+            "insert",
+            "print_screen",
+            "pause",
+        }
+    )
+
     def __init__(self, on_event: Optional[Callable[[RawRecord], None]] = None):
         super().__init__(on_event)
-        self.event_queue: Queue = Queue()
         self.monitor = None
-        self.processing_thread: Optional[threading.Thread] = None
-        self._last_key_time = 0
-        self._key_buffer = []
-        self._buffer_timeout = 0.1  # Keys within 100ms will be merged
+        # Merge window bookkeeping uses integer monotonic nanoseconds
+        self._last_key_ns = 0
+        self._key_buffer: Deque[RawRecord] = deque()
+        # stop() drains from the manager thread while the NSEvent handler may
+        # be draining the same buffer
+        self._buffer_lock = threading.Lock()
+        self._buffer_timeout_ns = 100_000_000  # Keys within 100ms will be merged
+        # Rapid consecutive keys are merged until this deadline passes
+        self._flush_at_ns = 0
+        # Flush early once this many records are merged. Auto-repeat only bumps
+        # the buffered press's repeat count, so the cap is reached only by
+        # distinct key events arriving without a 100ms gap (sustained fast typing
+        # or scripted input)
+        self._max_buffer_size = 1024
 
     def capture(self) -> RawRecord:
         """Capture keyboard event (sync method, for testing)"""
@@ -71,10 +181,14 @@ class MacOSKeyboardMonitor(BaseKeyboardMonitor):
 
     def output(self) -> None:
         """Output processed data"""
-        if self.on_event:
-            for record in self._key_buffer:
-                self.on_event(record)
-        self._key_buffer.clear()
+        with self._buffer_lock:
+            records = list(self._key_buffer)
+            self._key_buffer.clear()
+
+        on_event = self.on_event
+        if on_event:
+            for record in records:
+                on_event(record)
 
     def start(self):
         """Start keyboard listening"""
@@ -96,12 +210,6 @@ class MacOSKeyboardMonitor(BaseKeyboardMonitor):
                 mask, self._event_handler
             )
 
-            # Start event processing thread
-            self.processing_thread = threading.Thread(
-                target=self._process_events, daemon=True
-            )
-            self.processing_thread.start()
-
             logger.debug("✅ macOS keyboard listener started (using PyObjC NSEvent)")
             logger.debug(
                 "   If unable to capture keys, check System Preferences -> Security & Privacy -> Accessibility"
@@ -125,22 +233,8 @@ class MacOSKeyboardMonitor(BaseKeyboardMonitor):
                 NSEvent.removeMonitor_(self.monitor)
                 self.monitor = None
 
-            # Wait for processing thread to end
-            if self.processing_thread and self.processing_thread.is_alive():
-                logger.debug("Waiting for keyboard processing thread to end...")
-                self.processing_thread.join(timeout=3.0)
-                if self.processing_thread.is_alive():
-                    logger.warning(
-                        "Keyboard processing thread did not end within timeout, but continuing"
-                    )
-                self.processing_thread = None
-
-            # Clear event queue
-            while not self.event_queue.empty():
-                try:
-                    self.event_queue.get_nowait()
-                except:
-                    break
+            # Output remaining buffer once no new events can be appended
+            self.output()
 
             logger.debug("macOS keyboard listener stopped")
 
@@ -149,215 +243,135 @@ class MacOSKeyboardMonitor(BaseKeyboardMonitor):
 
     def _event_handler(self, event):
         """NSEvent callback handler (runs in Cocoa main thread)"""
+        # Buffered records are only ever handed to on_event, so skip building
+        # them while no consumer is registered or after stop()
+        if not self.is_running or self.on_event is None:
+            return
+
         try:
             # Extract event data
             event_type = event.type()
-            modifiers = event.modifierFlags()
 
-            # Determine action type
-            if event_type == 10:  # NSKeyDown
-                action = "press"
-            elif event_type == 11:  # NSKeyUp
-                action = "release"
-            elif event_type == 12:  # NSFlagsChanged
-                action = "modifier"
-            else:
-                action = "unknown"
+            # Fold held-key autorepeat into the buffered press record
+            if event_type == _NS_KEY_DOWN and event.isARepeat():
+                if self._count_repeat(event.keyCode()):
+                    return
 
-            # Build event data
-            key_data = {
-                "action": action,
-                "modifiers": self._extract_modifiers(modifiers),
-                "timestamp": datetime.now().isoformat(),
-            }
+            modifiers = event.modifierFlags()
 
             # Add key code and character information (NSFlagsChanged events have no keyCode and characters)
-            if event_type == 12:  # NSFlagsChanged
+            if event_type == _NS_FLAGS_CHANGED:
                 # Modifier key event, infer key from modifiers
-                key_data["key_code"] = 0
-                key_data["key"] = self._get_modifier_key_name(modifiers)
-                key_data["key_type"] = "modifier"
+                key_code = 0
+                key = self._get_modifier_key_name(modifiers)
+                key_type = "modifier"
             else:
                 # Normal key event
                 key_code = event.keyCode()
-                key_data["key_code"] = key_code
 
                 # Try to get characters (only KeyDown/KeyUp have characters)
                 try:
                     characters = event.characters()
                     if characters and len(characters) > 0:
-                        key_data["key"] = characters
-                        key_data["key_type"] = "char"
+                        key = characters
+                        key_type = "char"
                     else:
-                        key_data["key"] = self._get_special_key_name(key_code)
-                        key_data["key_type"] = "special"
+                        key = self._get_special_key_name(key_code)
+                        key_type = "special"
                 except (AttributeError, RuntimeError):
                     # Some events don't have characters method
-                    key_data["key"] = self._get_special_key_name(key_code)
-                    key_data["key_type"] = "special"
+                    key = self._get_special_key_name(key_code)
+                    key_type = "special"
+
+            # Build event data in one literal rather than growing it key by key
+            key_data = {
+                "action": _ACTION_MAP.get(event_type, "unknown"),
+                "modifiers": self._extract_modifiers(modifiers),
+                "key_code": key_code,
+                "key": key,
+                "key_type": key_type,
+            }
 
-            # Put event into queue (thread-safe)
             record = RawRecord(
                 timestamp=datetime.now(), type=RecordType.KEYBOARD_RECORD, data=key_data
             )
-            self.event_queue.put(record)
+            self._buffer_record(record)
 
         except Exception as e:
             logger.error(f"Failed to process NSEvent: {e}")
 
-    def _process_events(self):
-        """Event processing thread (process events in queue in background)"""
-        import time
+    def _count_repeat(self, key_code: int) -> bool:
+        """Count an autorepeat on the still-buffered press of the same key
 
-        while self.is_running:
-            try:
-                # Get event from queue (non-blocking)
-                if not self.event_queue.empty():
-                    record = self.event_queue.get(timeout=0.1)
-                    current_time = time.time()
+        Returns False when that press was already output, in which case the
+        repeat is recorded as a normal key event.
+        """
+        with self._buffer_lock:
+            key_buffer = self._key_buffer
+            if not key_buffer:
+                return False
 
-                    # Check if keys need to be merged (rapid consecutive keys)
-                    if current_time - self._last_key_time < self._buffer_timeout:
-                        self._key_buffer.append(record)
-                    else:
-                        # Output previous buffered data
-                        self.output()
-                        # Add new event
-                        self._key_buffer.append(record)
-
-                    self._last_key_time = current_time
-                else:
-                    # Brief sleep when no events
-                    time.sleep(0.01)
-            except Exception as e:
-                if self.is_running:
-                    logger.error(f"Failed to handle keyboard event: {e}")
-
-        # Output remaining buffer before thread exit
-        self.output()
+            data = key_buffer[-1].data
+            if data.get("action") != "press" or data.get("key_code") != key_code:
+                return False
 
-    def _extract_modifiers(self, modifier_flags: int) -> list:
-        """Extract modifier list from modifier flags"""
-        modifiers = []
+            data["repeat"] = data.get("repeat", 0) + 1
+            return True
 
-        # NSEvent modifier flag bits
-        NSCommandKeyMask = 1 << 20
-        NSAlternateKeyMask = 1 << 19
-        NSShiftKeyMask = 1 << 17
-        NSControlKeyMask = 1 << 18
+    def _buffer_record(self, record: RawRecord) -> None:
+        """Merge rapid consecutive keys and output each burst once it ends"""
+        current_ns = time.monotonic_ns()
+        key_buffer = self._key_buffer
 
-        if modifier_flags & NSCommandKeyMask:
-            modifiers.append("cmd")
-        if modifier_flags & NSAlternateKeyMask:
-            modifiers.append("alt")
-        if modifier_flags & NSShiftKeyMask:
-            modifiers.append("shift")
-        if modifier_flags & NSControlKeyMask:
-            modifiers.append("ctrl")
+        # Output previous buffered data once the merge window closed
+        if key_buffer and current_ns >= self._flush_at_ns:
+            self.output()
 
-        return modifiers
+        with self._buffer_lock:
+            key_buffer.append(record)
+            buffer_full = len(key_buffer) >= self._max_buffer_size
+        if buffer_full:
+            self.output()
+
+        self._last_key_ns = current_ns
+        self._flush_at_ns = current_ns + self._buffer_timeout_ns
+
+    def _extract_modifiers(self, modifier_flags: int) -> list:
+        """Extract modifier list from modifier flags"""
+        # Most keystrokes carry no modifiers; skip the per-mask tests for them
+        if not modifier_flags & _ALL_MODIFIERS_MASK:
+            return []
+        return [name for mask, name in _MODIFIER_MASKS if modifier_flags & mask]
 
     def _get_special_key_name(self, key_code: int) -> str:
         """Get special key name from key code"""
-        # macOS key code mapping (common special keys)
-        key_map = {
-            36: "enter",
-            49: "space",
-            48: "tab",
-            51: "backspace",
-            53: "esc",
-            117: "delete",
-            122: "f1",
-            120: "f2",
-            99: "f3",
-            118: "f4",
-            96: "f5",
-            97: "f6",
-            98: "f7",
-            100: "f8",
-            101: "f9",
-            109: "f10",
-            103: "f11",
-            111: "f12",
-            123: "left",
-            124: "right",
-            125: "down",
-            126: "up",
-            115: "home",
-            119: "end",
-            116: "page_up",
-            121: "page_down",
-        }
-
-        return key_map.get(key_code, f"key_{key_code}")
+        return _SPECIAL_KEY_NAMES[key_code]
 
     def _get_modifier_key_name(self, modifier_flags: int) -> str:
         """Get key name from modifier flags (for NSFlagsChanged events)"""
-        # NSEvent modifier flag bits
-        NSCommandKeyMask = 1 << 20
-        NSAlternateKeyMask = 1 << 19
-        NSShiftKeyMask = 1 << 17
-        NSControlKeyMask = 1 << 18
-        NSCapsLockKeyMask = 1 << 16
-
         # Detect which modifier key is pressed
-        if modifier_flags & NSCommandKeyMask:
-            return "cmd"
-        elif modifier_flags & NSAlternateKeyMask:
-            return "alt"
-        elif modifier_flags & NSShiftKeyMask:
-            return "shift"
-        elif modifier_flags & NSControlKeyMask:
-            return "ctrl"
-        elif modifier_flags & NSCapsLockKeyMask:
+        for mask, name in _MODIFIER_MASKS:
+            if modifier_flags & mask:
+                return name
+        if modifier_flags & _NS_CAPS_LOCK_KEY_MASK:
             return "caps_lock"
-        else:
-            return "modifier"
+        return "modifier"
 
     def is_special_key(self, key_data: dict) -> bool:
         """Determine if it's a special key (needs to be recorded)"""
-        special_keys = {
-            "enter",
-            "space",
-            "tab",
-            "backspace",
-            "delete",
-            "up",
-            "down",
-            "left",
-            "right",
-            "home",
-            "end",
-            "page_up",
-            "page_down",
-            "f1",
-            "f2",
-            "f3",
-            "f4",
-            "f5",
-            "f6",
-            "f7",
-            "f8",
-            "f9",
-            "f10",
-            "f11",
-            "f12",
-            "esc",
-            "caps_lock",
-            "num_lock",
-            "scroll_lock",
-            "insert",
-            "print_screen",
-            "pause",
-        }
-
         key = key_data.get("key", "").lower()
         return (
-            key in special_keys
+            key in self._SPECIAL_KEYS
             or len(key_data.get("modifiers", [])) > 0
             or key_data.get("key_type") == "special"
         )
 
+    def _last_key_time(self) -> float:
+        """Wall-clock time of the last key event (0 if none yet)"""
+        if not self._last_key_ns:
+            return 0
+        return time.time() - (time.monotonic_ns() - self._last_key_ns) / 1e9
+
     def get_stats(self) -> Dict[str, Any]:
         """Get capture statistics"""
         stats = {
@@ -365,8 +379,7 @@ class MacOSKeyboardMonitor(BaseKeyboardMonitor):
             "platform": "macOS",
             "implementation": "PyObjC NSEvent",
             "buffer_size": len(self._key_buffer),
-            "queue_size": self.event_queue.qsize(),
-            "last_key_time": self._last_key_time,
+            "last_key_time": self._last_key_time(),
         }
 
         if not PYOBJC_AVAILABLE:
@@ -5,15 +5,26 @@ Using pynput library to monitor mouse operations (pynput mouse listening is safe
 
 import time
 from datetime import datetime
-from typing import Any, Callable, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, Optional
 
 from core.logger import get_logger
 from core.models import RawRecord, RecordType
 from perception.base import BaseMouseMonitor
+from perception.platforms._mouse_common import (
+    BUTTON_NAMES,
+    DragTracker,
+    ScrollMerger,
+    to_wall_time,
+)
 from pynput import mouse
 
 logger = get_logger(__name__)
 
+# Bound once so the pynput callbacks skip the attribute lookups per event
+_MOUSE_RECORD = RecordType.MOUSE_RECORD
+_now = datetime.now
+_mono = time.monotonic
+
 
 class MacOSMouseMonitor(BaseMouseMonitor):
     """macOS mouse event capturer (using pynput)"""
@@ -22,14 +33,11 @@ class MacOSMouseMonitor(BaseMouseMonitor):
         super().__init__(on_event)
         self.listener: Optional[mouse.Listener] = None
         self._last_click_time = 0
-        self._last_scroll_time = 0
-        self._scroll_buffer = []
         self._click_timeout = 0.5  # Clicks within 500ms will be merged
         self._scroll_timeout = 0.1  # Scrolls within 100ms will be merged
+        self._scroll = ScrollMerger(self._emit, timeout=self._scroll_timeout)
         self._last_position = (0, 0)
-        self._is_dragging = False
-        self._drag_start_pos = None
-        self._drag_start_time = None
+        self._drag = DragTracker()
 
     def capture(self) -> RawRecord:
         """Capture mouse event (synchronous method, for testing)"""
@@ -46,10 +54,13 @@ class MacOSMouseMonitor(BaseMouseMonitor):
 
     def output(self) -> None:
         """Output processed data"""
-        if self.on_event:
-            for record in self._scroll_buffer:
-                self.on_event(record)
-        self._scroll_buffer.clear()
+        self._scroll.flush()
+
+    def _emit(self, record: RawRecord) -> None:
+        """Hand a finished record to the consumer"""
+        on_event = self.on_event
+        if on_event:
+            on_event(record)
 
     def start(self):
         """Start mouse listening"""
@@ -87,44 +98,26 @@ class MacOSMouseMonitor(BaseMouseMonitor):
                 logger.error(f"Failed to stop mouse listener: {e}")
                 self.listener = None
 
+        # Hand off a scroll gesture that was still being merged
+        self.output()
+
     def _on_move(self, x: int, y: int):
         """Handle mouse move event"""
         if not self.is_running:
             return
 
-        try:
-            self._last_position = (x, y)
-
-            # Record drag event if dragging
-            if (
-                self._is_dragging
-                and self._drag_start_pos
-                and self._drag_start_time is not None
-            ):
-                current_time = time.time()
-                if (
-                    current_time - self._drag_start_time > 0.1
-                ):  # Only record if drag exceeds 100ms
-                    drag_data = {
-                        "action": "drag",
-                        "start_position": self._drag_start_pos,
-                        "current_position": (x, y),
-                        "duration": current_time - self._drag_start_time,
-                        "timestamp": datetime.now().isoformat(),
-                    }
-
-                    record = RawRecord(
-                        timestamp=datetime.now(),
-                        type=RecordType.MOUSE_RECORD,
-                        data=drag_data,
-                    )
-
-                    if self.on_event:
-                        self.on_event(record)
+        # Most moves happen without a button held; only track the position
+        self._last_position = (x, y)
+        if not self._drag.active:
+            return
 
-                    # Update drag start position to avoid duplicate records
-                    self._drag_start_pos = (x, y)
-                    self._drag_start_time = current_time
+        try:
+            # Record drag event once the pointer has really moved
+            drag_data = self._drag.step(x, y)
+            if drag_data is not None:
+                self._emit(
+                    RawRecord(timestamp=_now(), type=_MOUSE_RECORD, data=drag_data)
+                )
 
         except Exception as e:
             logger.error(f"Failed to handle mouse move event: {e}")
@@ -135,59 +128,38 @@ class MacOSMouseMonitor(BaseMouseMonitor):
             return
 
         try:
-            current_time = time.time()
-            button_name = button.name if hasattr(button, "name") else str(button)
+            current_time = _mono()
+            button_name = BUTTON_NAMES[button]
+
+            # Keep record order: a finished scroll gesture precedes this click
+            if self._scroll.pending:
+                self.output()
 
             if pressed:
                 # Mouse press down
                 self._last_click_time = current_time
-                self._is_dragging = True
-                self._drag_start_pos = (x, y)
-                self._drag_start_time = current_time
+                self._drag.press(current_time, x, y)
 
                 click_data = {
                     "action": "press",
                     "button": button_name,
                     "position": (x, y),
-                    "timestamp": datetime.now().isoformat(),
                 }
 
             else:
-                # Mouse release
-                self._is_dragging = False
-
-                # Determine if it's click or drag
-                if (
-                    self._drag_start_pos
-                    and self._drag_start_time is not None
-                    and current_time - self._drag_start_time > 0.1
-                    and self._distance(self._drag_start_pos, (x, y)) > 5
-                ):
-                    # Drag end
-                    click_data = {
-                        "action": "drag_end",
-                        "button": button_name,
-                        "position": (x, y),
-                        "start_position": self._drag_start_pos,
-                        "end_position": (x, y),
-                        "duration": current_time - self._drag_start_time,
-                        "timestamp": datetime.now().isoformat(),
-                    }
+                # Mouse release: drag end, or a normal click
+                click_data = self._drag.release(current_time, x, y, button_name)
+                if click_data is not None:
+                    # Keep the release position alongside the drag endpoints
+                    click_data["position"] = (x, y)
                 else:
-                    # Normal click
                     click_data = {
                         "action": "release",
                         "button": button_name,
                         "position": (x, y),
-                        "timestamp": datetime.now().isoformat(),
                     }
 
-                self._drag_start_pos = None
-                self._drag_start_time = None
-
-            record = RawRecord(
-                timestamp=datetime.now(), type=RecordType.MOUSE_RECORD, data=click_data
-            )
+            record = RawRecord(timestamp=_now(), type=_MOUSE_RECORD, data=click_data)
 
             if self.on_event:
                 self.on_event(record)
@@ -201,55 +173,31 @@ class MacOSMouseMonitor(BaseMouseMonitor):
             return
 
         try:
-            current_time = time.time()
-
-            # Merge consecutive scroll events
-            if (
-                current_time - self._last_scroll_time < self._scroll_timeout
-                and self._scroll_buffer
-            ):
-                # Merge to last scroll event
-                last_record = self._scroll_buffer[-1]
-                last_data = last_record.data
-                dy += last_data.get("dy", 0)
-
-                # Update last scroll event
-                last_data["dy"] = dy
-            else:
-                # New scroll event
+            current_time = _mono()
+
+            # Merge consecutive scroll events into the pending gesture
+            if not self._scroll.merge(current_time, x, y, dx, dy):
                 scroll_data = {
                     "action": "scroll",
                     "button": "middle",
                     "position": (x, y),
                     "dx": dx,
                     "dy": dy,
-                    "timestamp": datetime.now().isoformat(),
                 }
 
-                record = RawRecord(
-                    timestamp=datetime.now(),
-                    type=RecordType.MOUSE_RECORD,
-                    data=scroll_data,
+                # A new gesture starts; the previous one is output first
+                self._scroll.start(
+                    current_time,
+                    RawRecord(
+                        timestamp=_now(),
+                        type=_MOUSE_RECORD,
+                        data=scroll_data,
+                    ),
                 )
 
-                self._scroll_buffer.append(record)
-
-            self._last_scroll_time = current_time
-
-            # Periodically output scroll events
-            if (
-                len(self._scroll_buffer) >= 5
-                or current_time - self._last_scroll_time > 1.0
-            ):
-                self.output()
-
         except Exception as e:
             logger.error(f"Failed to handle mouse scroll event: {e}")
 
-    def _distance(self, pos1: Tuple[int, int], pos2: Tuple[int, int]) -> float:
-        """Calculate distance between two points"""
-        return ((pos1[0] - pos2[0]) ** 2 + (pos1[1] - pos2[1]) ** 2) ** 0.5
-
     def is_important_event(self, event_data: dict) -> bool:
         """Determine if it's an important event (needs to be recorded)"""
         action = event_data.get("action", "")
@@ -262,8 +210,8 @@ class MacOSMouseMonitor(BaseMouseMonitor):
             "platform": "macOS",
             "implementation": "pynput",
             "last_position": self._last_position,
-            "is_dragging": self._is_dragging,
-            "scroll_buffer_size": len(self._scroll_buffer),
-            "last_click_time": self._last_click_time,
-            "last_scroll_time": self._last_scroll_time,
+            "is_dragging": self._drag.active,
+            "pending_scroll": self._scroll.pending,
+            "last_click_time": to_wall_time(self._last_click_time),
+            "last_scroll_time": to_wall_time(self._scroll.last_time),
         }
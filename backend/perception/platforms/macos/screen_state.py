@@ -3,13 +3,22 @@ macOS screen state monitor implementation
 """
 
 from importlib import import_module
-from typing import Callable, Optional
+from typing import Any, Callable, Optional
 
 from core.logger import get_logger
 from perception.base import BaseEventListener
 
 logger = get_logger(__name__)
 
+# Resolve AppKit once at import; start() and stop() only check the binding
+NSWorkspace: Any = None
+_APPKIT_IMPORT_ERROR: Optional[Exception] = None
+
+try:
+    NSWorkspace = getattr(import_module("AppKit"), "NSWorkspace")
+except Exception as exc:
+    _APPKIT_IMPORT_ERROR = exc
+
 
 class MacOSScreenStateMonitor(BaseEventListener):
     """macOS screen state monitor"""
@@ -35,10 +44,13 @@ class MacOSScreenStateMonitor(BaseEventListener):
         if self.is_running:
             return
 
-        try:
-            appkit = import_module("AppKit")
-            NSWorkspace = getattr(appkit, "NSWorkspace")
+        if NSWorkspace is None:
+            logger.error(
+                f"Failed to start macOS screen state monitor: {_APPKIT_IMPORT_ERROR}"
+            )
+            return
 
+        try:
             self.is_running = True
 
             # Get notification center
@@ -94,8 +106,6 @@ class MacOSScreenStateMonitor(BaseEventListener):
             return
 
         try:
-            appkit = import_module("AppKit")
-            NSWorkspace = getattr(appkit, "NSWorkspace")
             self.is_running = False
 
             # Remove all observers
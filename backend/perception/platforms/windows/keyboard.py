@@ -18,6 +18,48 @@ logger = get_logger(__name__)
 class WindowsKeyboardMonitor(BaseKeyboardMonitor):
     """Windows keyboard event capturer (using pynput)"""
 
+    # Keys that are always worth recording, shared by all instances
+    _SPECIAL_KEYS = frozenset(
+        {
+            "enter",
+            "space",
+            "tab",
+            "backspace",
+            "delete",
+            "up",
+            "down",
+            "left",
+            "right",
+            "home",
+            "end",
+            "page_up",
+            "page_down",
+            "f1",
+            "f2",
+            "f3",
+            "f4",
+            "f5",
+            "f6",
+            "f7",
+            "f8",
+            "f9",
+            "f10",
+            "f11",
+            "f12",
+            "esc",
+            "caps_lock",
+            "num_lock",
+            "scroll_lock",
+            "insert",
+            "print_screen",
+            "pause",
+            "cmd",
+            "alt",
+            "ctrl",
+            "shift",
+        }
+    )
+
     def __init__(self, on_event: Optional[Callable[[RawRecord], None]] = None):
         super().__init__(on_event)
         self.listener: Optional[keyboard.Listener] = None
@@ -77,35 +119,39 @@ class WindowsKeyboardMonitor(BaseKeyboardMonitor):
 
     def _on_press(self, key):
         """Handle key press event"""
-        if not self.is_running:
+        on_event = self.on_event
+        if not self.is_running or on_event is None:
             return
 
         try:
             key_data = self._extract_key_data(key, "press")
-            record = RawRecord(
-                timestamp=datetime.now(), type=RecordType.KEYBOARD_RECORD, data=key_data
+            on_event(
+                RawRecord(
+                    timestamp=datetime.now(),
+                    type=RecordType.KEYBOARD_RECORD,
+                    data=key_data,
+                )
             )
 
-            if self.on_event:
-                self.on_event(record)
-
         except Exception as e:
             logger.error(f"Failed to handle key event: {e}")
 
     def _on_release(self, key):
         """Handle key release event"""
-        if not self.is_running:
+        on_event = self.on_event
+        if not self.is_running or on_event is None:
             return
 
         try:
             key_data = self._extract_key_data(key, "release")
-            record = RawRecord(
-                timestamp=datetime.now(), type=RecordType.KEYBOARD_RECORD, data=key_data
+            on_event(
+                RawRecord(
+                    timestamp=datetime.now(),
+                    type=RecordType.KEYBOARD_RECORD,
+                    data=key_data,
+                )
             )
 
-            if self.on_event:
-                self.on_event(record)
-
         except Exception as e:
             logger.error(f"Failed to handle key release event: {e}")
 
@@ -126,7 +172,6 @@ class WindowsKeyboardMonitor(BaseKeyboardMonitor):
                 "key_type": key_type,
                 "action": action,
                 "modifiers": [],  # pynput doesn't directly provide current modifier key status
-                "timestamp": datetime.now().isoformat(),
             }
         except Exception as e:
             logger.error(f"Failed to extract key data: {e}")
@@ -134,52 +179,12 @@ class WindowsKeyboardMonitor(BaseKeyboardMonitor):
                 "key": "unknown",
                 "action": action,
                 "modifiers": [],
-                "timestamp": datetime.now().isoformat(),
             }
 
     def is_special_key(self, key_data: dict) -> bool:
         """Determine if it's a special key (needs to be recorded)"""
-        special_keys = {
-            "enter",
-            "space",
-            "tab",
-            "backspace",
-            "delete",
-            "up",
-            "down",
-            "left",
-            "right",
-            "home",
-            "end",
-            "page_up",
-            "page_down",
-            "f1",
-            "f2",
-            "f3",
-            "f4",
-            "f5",
-            "f6",
-            "f7",
-            "f8",
-            "f9",
-            "f10",
-            "f11",
-            "f12",
-            "esc",
-            "caps_lock",
-            "num_lock",
-            "scroll_lock",
-            "insert",
-            "print_screen",
-            "pause",
-            "cmd",
-            "alt",
-            "ctrl",
-            "shift",
-        }
-
         key = key_data.get("key", "").lower()
-        return key in special_keys or key_data.get("key_type") == "special"
+        return key in self._SPECIAL_KEYS or key_data.get("key_type") == "special"
 
     def get_stats(self) -> Dict[str, Any]:
         """Get capture statistics"""
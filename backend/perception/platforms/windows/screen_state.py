@@ -3,13 +3,35 @@ Windows screen state monitor implementation
 """
 
 import threading
-from typing import Callable, Optional
+from importlib import import_module
+from typing import Any, Callable, Optional
 
 from core.logger import get_logger
 from perception.base import BaseEventListener
 
 logger = get_logger(__name__)
 
+# Resolve pywin32 once at import; start() only checks the flag and the window
+# procedure compares against plain module-level constants
+win32api: Any = None
+win32con: Any = None
+win32gui: Any = None
+_PYWIN32_IMPORT_ERROR: Optional[Exception] = None
+
+try:
+    win32api = import_module("win32api")
+    win32con = import_module("win32con")
+    win32gui = import_module("win32gui")
+    _WM_POWERBROADCAST = win32con.WM_POWERBROADCAST
+    _PBT_APMSUSPEND = win32con.PBT_APMSUSPEND
+    _PBT_APMRESUMEAUTOMATIC = win32con.PBT_APMRESUMEAUTOMATIC
+    PYWIN32_AVAILABLE = True
+except Exception as exc:
+    # pywin32 DLL load failures raise more than ImportError
+    _WM_POWERBROADCAST = _PBT_APMSUSPEND = _PBT_APMRESUMEAUTOMATIC = None
+    PYWIN32_AVAILABLE = False
+    _PYWIN32_IMPORT_ERROR = exc
+
 
 class WindowsScreenStateMonitor(BaseEventListener):
     """Windows screen state monitor"""
@@ -30,18 +52,21 @@ class WindowsScreenStateMonitor(BaseEventListener):
         self.on_screen_lock = on_screen_lock
         self.on_screen_unlock = on_screen_unlock
         self._thread: Optional[threading.Thread] = None
+        self._thread_id: Optional[int] = None
 
     def start(self) -> None:
         """Start listening"""
         if self.is_running:
             return
 
-        try:
-            # Check if required modules are available
-            import win32api  # type: ignore  # noqa: F401
-            import win32con  # type: ignore  # noqa: F401
-            import win32gui  # type: ignore  # noqa: F401
+        if not PYWIN32_AVAILABLE:
+            logger.error(
+                "Cannot import pywin32 (%s), screen state monitor unavailable",
+                _PYWIN32_IMPORT_ERROR,
+            )
+            return
 
+        try:
             self.is_running = True
 
             # Monitor Windows messages in background thread
@@ -50,10 +75,6 @@ class WindowsScreenStateMonitor(BaseEventListener):
 
             logger.debug("Windows screen state monitor started")
 
-        except ImportError:
-            logger.error("Cannot import pywin32, screen state monitor unavailable")
-            self.is_running = False
-
         except Exception as e:
             logger.error(f"Failed to start Windows screen state monitor: {e}")
             self.is_running = False
@@ -61,10 +82,6 @@ class WindowsScreenStateMonitor(BaseEventListener):
     def _message_loop(self) -> None:
         """Windows message loop"""
         try:
-            import win32api  # type: ignore
-            import win32con  # type: ignore
-            import win32gui  # type: ignore
-
             # Create hidden window to receive messages
             wc = win32gui.WNDCLASS()
             wc.lpfnWndProc = self._wnd_proc
@@ -86,11 +103,13 @@ class WindowsScreenStateMonitor(BaseEventListener):
                 None,
             )
 
-            # Message loop
-            while self.is_running:
-                win32gui.PumpWaitingMessages()
-                threading.Event().wait(0.1)
+            # Block in the message loop until stop() posts WM_QUIT; stop() sets
+            # is_running before reading the thread id, so re-check it here
+            self._thread_id = win32api.GetCurrentThreadId()
+            if self.is_running:
+                win32gui.PumpMessages()
 
+            self._thread_id = None
             win32gui.DestroyWindow(hwnd)
             win32gui.UnregisterClass(class_atom, wc.hInstance)
 
@@ -99,15 +118,13 @@ class WindowsScreenStateMonitor(BaseEventListener):
 
     def _wnd_proc(self, hwnd, msg, wparam, lparam):
         """Windows window message handling"""
-        import win32con  # type: ignore
-
-        if msg == win32con.WM_POWERBROADCAST:
-            if wparam == win32con.PBT_APMSUSPEND:
+        if msg == _WM_POWERBROADCAST:
+            if wparam == _PBT_APMSUSPEND:
                 # System suspend
                 logger.debug("System suspend detected")
                 if self.on_screen_lock:
                     self.on_screen_lock()
-            elif wparam == win32con.PBT_APMRESUMEAUTOMATIC:
+            elif wparam == _PBT_APMRESUMEAUTOMATIC:
                 # System resume
                 logger.debug("System resume detected")
                 if self.on_screen_unlock:
@@ -122,6 +139,13 @@ class WindowsScreenStateMonitor(BaseEventListener):
 
         self.is_running = False
 
+        thread_id = self._thread_id
+        if thread_id is not None:
+            try:
+                win32api.PostThreadMessage(thread_id, win32con.WM_QUIT, 0, 0)
+            except Exception as e:
+                logger.error(f"Failed to stop Windows message loop: {e}")
+
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=2.0)
 
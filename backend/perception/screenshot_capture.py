@@ -270,8 +270,11 @@ class ScreenshotCapture(BaseCapture):
             logger.error(f"Failed to convert image to bytes: {e}")
             return b""
 
-    def capture_with_interval(self, interval: float = 1.0):
-        """Capture screen screenshots at specified interval"""
+    def capture_once(self) -> None:
+        """Capture screen screenshots now if the capturer is running
+
+        Interval pacing is left to the caller.
+        """
         if not self.is_running:
             # Only log warning once when not started (avoid spamming logs during sleep/idle)
             if not self._not_started_warning_logged:
@@ -279,10 +282,8 @@ class ScreenshotCapture(BaseCapture):
                 self._not_started_warning_logged = True
             return
 
-        current_time = time.time()
-        if current_time - self._last_screenshot_time >= interval:
-            self.capture()
-            self._last_screenshot_time = current_time
+        self._last_screenshot_time = time.time()
+        self.capture()
 
     def get_monitor_info(self) -> dict:
         """Get monitor information"""
@@ -5,8 +5,8 @@ Implement 20-second temporary sliding window with automatic deletion on timeout
 
 import time
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
-from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+from collections import defaultdict, deque
 from threading import Lock
 from core.models import RawRecord, RecordType
 from core.logger import get_logger
@@ -25,7 +25,10 @@ class SlidingWindowStorage:
             window_size: Window size (seconds)
         """
         self.window_size = window_size
+        self._window = timedelta(seconds=window_size)
         self.records: deque = deque()
+        # Per-type secondary index, kept in the same insertion order as records
+        self._by_type: Dict[RecordType, Deque[RawRecord]] = defaultdict(deque)
         self.lock = Lock()
         self._last_cleanup = time.time()
         self._cleanup_interval = 5.0  # Clean up expired data every 5 seconds
@@ -35,6 +38,7 @@ class SlidingWindowStorage:
         try:
             with self.lock:
                 self.records.append(record)
+                self._by_type[record.type].append(record)
 
                 # Periodically clean up expired data
                 current_time = time.time()
@@ -67,12 +71,16 @@ class SlidingWindowStorage:
                 # First clean up expired data
                 self._cleanup_expired_records()
 
-                filtered_records = []
-                for record in self.records:
-                    # Type filter
-                    if event_type and record.type != event_type:
-                        continue
+                # Type filter via the per-type index
+                if event_type:
+                    source = self._by_type.get(event_type, ())
+                    if not start_time and not end_time:
+                        return list(source)
+                else:
+                    source = self.records
 
+                filtered_records = []
+                for record in source:
                     # Time filter
                     if start_time and record.timestamp < start_time:
                         continue
@@ -107,15 +115,40 @@ class SlidingWindowStorage:
         """Get records within specified time range"""
         return self.get_records(start_time=start_time, end_time=end_time)
 
+    def get_records_in_last_n_seconds(self, seconds: float) -> List[RawRecord]:
+        """Get records from the last N seconds
+
+        Monitors append from several threads and some records (merged scrolls,
+        buffered keys) arrive after newer ones, so the whole window is
+        filtered rather than stopping at the first older record.
+        """
+        try:
+            cutoff_time = datetime.now() - timedelta(seconds=seconds)
+            with self.lock:
+                return [
+                    record for record in self.records if record.timestamp >= cutoff_time
+                ]
+        except Exception as e:
+            logger.error(f"Failed to get records from last {seconds} seconds: {e}")
+            return []
+
+    def cleanup_expired_records(self) -> None:
+        """Clean up expired records under the storage lock"""
+        with self.lock:
+            self._cleanup_expired_records()
+
     def _cleanup_expired_records(self) -> None:
         """Clean up expired records"""
         try:
-            current_time = datetime.now()
-            cutoff_time = current_time - timedelta(seconds=self.window_size)
+            cutoff_time = datetime.now() - self._window
 
-            # Remove expired records from left side
-            while self.records and self.records[0].timestamp < cutoff_time:
-                self.records.popleft()
+            # Records are appended in timestamp order, so expiry is a prefix
+            # trim: only the evicted records are touched, never the full window
+            records = self.records
+            by_type = self._by_type
+            while records and records[0].timestamp < cutoff_time:
+                # The evicted record is also the oldest of its type
+                by_type[records.popleft().type].popleft()
 
         except Exception as e:
             logger.error(f"Failed to clean up expired records: {e}")
@@ -125,6 +158,7 @@ class SlidingWindowStorage:
         try:
             with self.lock:
                 self.records.clear()
+                self._by_type.clear()
                 logger.debug("Sliding window storage cleared")
         except Exception as e:
             logger.error(f"Failed to clear storage: {e}")
@@ -136,10 +170,11 @@ class SlidingWindowStorage:
                 self._cleanup_expired_records()
 
                 # Count records by type
-                type_counts = {}
-                for record in self.records:
-                    type_name = record.type.value
-                    type_counts[type_name] = type_counts.get(type_name, 0) + 1
+                type_counts = {
+                    record_type.value: len(records)
+                    for record_type, records in self._by_type.items()
+                    if records
+                }
 
                 return {
                     "total_records": len(self.records),
@@ -163,28 +198,27 @@ class EventBuffer:
 
     def __init__(self, max_size: int = 1000):
         self.max_size = max_size
-        self.buffer: List[RawRecord] = []
+        # Bounded deque: append/popleft are atomic under the GIL and the
+        # oldest record is dropped automatically once max_size is reached,
+        # so the per-event add path needs neither a lock nor a list shift
+        self.buffer: Deque[RawRecord] = deque(maxlen=max_size)
+        # Serializes consumers (drain/clear); producers never take it
         self.lock = Lock()
 
     def add(self, record: RawRecord) -> None:
         """Add event to buffer"""
-        try:
-            with self.lock:
-                self.buffer.append(record)
-
-                # If buffer is full, remove oldest record
-                if len(self.buffer) > self.max_size:
-                    self.buffer.pop(0)
-
-        except Exception as e:
-            logger.error(f"Failed to add event to buffer: {e}")
+        self.buffer.append(record)
 
     def get_all(self) -> List[RawRecord]:
         """Get all events and clear buffer"""
         try:
             with self.lock:
-                events = self.buffer.copy()
-                self.buffer.clear()
+                # Drain with popleft so records appended concurrently are
+                # either returned now or kept for the next call, never lost
+                events: List[RawRecord] = []
+                popleft = self.buffer.popleft
+                while self.buffer:
+                    events.append(popleft())
                 return events
         except Exception as e:
             logger.error(f"Failed to get buffer events: {e}")
@@ -193,8 +227,10 @@ class EventBuffer:
     def peek(self) -> List[RawRecord]:
         """Peek at buffer contents without clearing"""
         try:
-            with self.lock:
-                return self.buffer.copy()
+            # Producers append without the lock; deque.copy() snapshots in a
+            # single C call, whereas iterating the live deque could raise
+            # "deque mutated during iteration"
+            return list(self.buffer.copy())
         except Exception as e:
             logger.error(f"Failed to peek buffer: {e}")
             return []
@@ -209,9 +245,4 @@ class EventBuffer:
 
     def size(self) -> int:
         """Get buffer size"""
-        try:
-            with self.lock:
-                return len(self.buffer)
-        except Exception as e:
-            logger.error(f"Failed to get buffer size: {e}")
-            return 0
+        return len(self.buffer)
@@ -40,7 +40,7 @@ export type Modelid2 = string
 export type Model = string
 export type Prompttokens = number
 export type Completiontokens = number
-export type Totaltokens = number
+export type Totaltokens = (number | null)
 export type Cost = number
 export type Requesttype = string
 export type Dimension = string
@@ -60,7 +60,7 @@ export type RootModelStr = string
 export type Hashes = string[]
 export type Maxagehours = number
 export type Enabled1 = (boolean | null)
-export type Strategy = (string | null)
+export type Strategy = (("none" | "sampling" | "content_aware" | "hybrid") | null)
 export type Phashthreshold = (number | null)
 export type Mininterval = (number | null)
 export type Maximages = (number | null)
@@ -95,7 +95,7 @@ export type Apiurl = string
 export type Model1 = string
 export type Inputtokenprice = number
 export type Outputtokenprice = number
-export type Currency = string
+export type Currency = ("USD" | "CNY" | "EUR" | "GBP" | "JPY")
 export type Apikey = string
 export type Modelid3 = string
 export type Name2 = (string | null)
@@ -107,11 +107,8 @@ export type Outputtokenprice1 = (number | null)
  * Provider identifier
  */
 export type Provider1 = (string | null)
-export type Currency1 = (string | null)
+export type Currency1 = (("USD" | "CNY" | "EUR" | "GBP" | "JPY") | null)
 export type Apikey1 = (string | null)
-export type Modelid4 = string
-export type Modelid5 = string
-export type Modelid6 = string
 export type Limit6 = number
 export type Eventtype = (string | null)
 export type Starttime = (string | null)
@@ -137,15 +134,9 @@ export type Version = number
 export type Limit9 = number
 export type Startdate1 = string
 export type Enddate1 = string
-export type Startdate2 = string
-export type Enddate2 = string
-export type Startdate3 = string
-export type Enddate3 = string
-export type Startdate4 = string
-export type Enddate4 = string
 export type Databasepath = (string | null)
 export type Screenshotsavepath = (string | null)
-export type Compressionlevel = (string | null)
+export type Compressionlevel = (("ultra" | "aggressive" | "balanced" | "quality") | null)
 export type Enableregioncropping = (boolean | null)
 export type Cropthreshold = (number | null)
 export type Show = string
@@ -244,7 +235,7 @@ input: void | undefined
 output: RootModelDictStrAny
 }
 get_llm_stats_by_model: {
-input: GetLLMStatsByModelRequest
+input: ModelIdRequest
 output: RootModelDictStrAny
 }
 record_llm_usage: {
@@ -388,7 +379,7 @@ input: UpdateModelRequest
 output: RootModelDictStrAny
 }
 delete_model: {
-input: DeleteModelRequest
+input: ModelIdRequest
 output: RootModelDictStrAny
 }
 list_models: {
@@ -400,11 +391,11 @@ input: void | undefined
 output: RootModelDictStrAny
 }
 select_model: {
-input: SelectModelRequest
+input: ModelIdRequest
 output: RootModelDictStrAny
 }
 test_model: {
-input: TestModelRequest
+input: ModelIdRequest
 output: RootModelDictStrAny
 }
 migrate_models_to_openai: {
@@ -508,19 +499,19 @@ input: GetActivityCountByDateRequest
 output: RootModelDictStrAny
 }
 delete_activities_by_date: {
-input: DeleteActivitiesByDateRequest
+input: DeleteByDateRangeRequest
 output: RootModelDictStrAny
 }
 delete_knowledge_by_date: {
-input: DeleteKnowledgeByDateRequest
+input: DeleteByDateRangeRequest
 output: RootModelDictStrAny
 }
 delete_todos_by_date: {
-input: DeleteTodosByDateRequest
+input: DeleteByDateRangeRequest
 output: RootModelDictStrAny
 }
 delete_diaries_by_date: {
-input: DeleteDiariesByDateRequest
+input: DeleteByDateRangeRequest
 output: RootModelDictStrAny
 }
 get_monitors: {
@@ -757,11 +748,13 @@ export interface CancelStreamRequest {
 conversationId: Conversationid4
 }
 /**
- * Request parameters for retrieving LLM statistics of a specific model.
+ * Request parameters for operating on a single model configuration.
  * 
- * @property modelId - The model configuration ID.
+ * Shared by delete/select/test and per-model LLM statistics requests.
+ * 
+ * @property modelId - The ID of the model configuration.
  */
-export interface GetLLMStatsByModelRequest {
+export interface ModelIdRequest {
 modelId: Modelid2
 }
 /**
@@ -770,7 +763,7 @@ modelId: Modelid2
  * @property model - The LLM model name used.
  * @property promptTokens - Number of prompt tokens consumed.
  * @property completionTokens - Number of completion tokens consumed.
- * @property totalTokens - Total number of tokens consumed.
+ * @property totalTokens - Total number of tokens consumed (optional, defaults to prompt + completion).
  * @property cost - Cost of the request (optional).
  * @property requestType - Type of request (e.g., 'summarization', 'agent', 'chat').
  */
@@ -851,7 +844,7 @@ maxAgeHours?: Maxagehours
  * Request parameters for updating image optimization configuration.
  * 
  * @property enabled - Whether image optimization is enabled.
- * @property strategy - Optimization strategy ('phash', 'sampling', 'hybrid').
+ * @property strategy - Optimization strategy ('none', 'sampling', 'content_aware', 'hybrid').
  * @property phashThreshold - Perceptual hash similarity threshold (0.0-1.0).
  * @property minInterval - Minimum time interval between images (seconds).
  * @property maxImages - Maximum number of images per event.
@@ -1003,30 +996,6 @@ provider?: Provider1
 currency?: Currency1
 apiKey?: Apikey1
 }
-/**
- * Request parameters for deleting a model configuration.
- * 
- * @property modelId - The ID of the model to delete.
- */
-export interface DeleteModelRequest {
-modelId: Modelid4
-}
-/**
- * Request parameters for selecting/switching to a model.
- * 
- * @property modelId - The ID of the model to activate.
- */
-export interface SelectModelRequest {
-modelId: Modelid5
-}
-/**
- * Request parameters for testing model connectivity.
- * 
- * @property modelId - The ID of the model to test.
- */
-export interface TestModelRequest {
-modelId: Modelid6
-}
 /**
  * Request parameters for getting records.
  * 
@@ -1136,45 +1105,15 @@ export interface GetActivityCountByDateRequest {
 
 }
 /**
- * Request parameters for deleting activities in a date range.
+ * Request parameters for deleting items (activities/knowledge/todos/diaries) in a date range.
  * 
  * @property startDate - Start date in YYYY-MM-DD format.
  * @property endDate - End date in YYYY-MM-DD format.
  */
-export interface DeleteActivitiesByDateRequest {
+export interface DeleteByDateRangeRequest {
 startDate: Startdate1
 endDate: Enddate1
 }
-/**
- * Request parameters for deleting knowledge in a date range.
- * 
- * @property startDate - Start date in YYYY-MM-DD format.
- * @property endDate - End date in YYYY-MM-DD format.
- */
-export interface DeleteKnowledgeByDateRequest {
-startDate: Startdate2
-endDate: Enddate2
-}
-/**
- * Request parameters for deleting todos in a date range.
- * 
- * @property startDate - Start date in YYYY-MM-DD format.
- * @property endDate - End date in YYYY-MM-DD format.
- */
-export interface DeleteTodosByDateRequest {
-startDate: Startdate3
-endDate: Enddate3
-}
-/**
- * Request parameters for deleting diaries in a date range.
- * 
- * @property startDate - Start date in YYYY-MM-DD format.
- * @property endDate - End date in YYYY-MM-DD format.
- */
-export interface DeleteDiariesByDateRequest {
-startDate: Startdate4
-endDate: Enddate4
-}
 /**
  * Request parameters for updating application settings.
  * 